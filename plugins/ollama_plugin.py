@@ -15,6 +15,7 @@ from .base_plugin import BasePlugin
 
 DEFAULT_SYSTEM_PROMPT_PATH = Path(__file__).resolve().parent.parent / "prompts" / "ollama_monitor_system_prompt.txt"
 MENTION_PATTERN = re.compile(r"@[0-9A-Za-z_\-]+")
+WAIT_SUCCESS_PREFIX = re.compile(r"^✅\s*WAIT SUCCESS\s*—\s*")
 
 
 def _read_prompt(path_like: Optional[str]) -> Optional[str]:
@@ -37,7 +38,10 @@ def _normalize_sender(sender: Optional[str]) -> Optional[str]:
     match = MENTION_PATTERN.search(sender)
     if match:
         return match.group(0)
-    cleaned = re.sub(r"^✅\s*WAIT SUCCESS\s*—\s*", "", sender.strip(), flags=re.IGNORECASE)
+    cleaned = sender.strip()
+    # The server always emits the marker in upper case; skip the regex otherwise.
+    if "WAIT SUCCESS" in cleaned:
+        cleaned = WAIT_SUCCESS_PREFIX.sub("", cleaned)
     cleaned = cleaned.lstrip("-–—: ")
     if cleaned.startswith("@"):
         token = cleaned.split()[0].rstrip("—:,")
@@ -56,15 +60,12 @@ def _ensure_sender_prefix(reply: str, sender: Optional[str]) -> str:
     stripped = cleaned.lstrip("-–—: ")
     return f"{normalized} — {stripped}"
 
-def _contains_handle(text: str, handle: Optional[str]) -> bool:
-    """Return True if the exact handle appears as an @mention in the text."""
-    if not text or not handle:
-        return False
-    handle_lower = handle.lower()
-    for mention in MENTION_PATTERN.findall(text):
-        if mention.lower() == handle_lower:
-            return True
-    return False
+def _missing_handles(text: str, handles: list[str]) -> list[str]:
+    """Return the handles that do not appear as @mentions in the text (single scan)."""
+    if not handles:
+        return []
+    present = {mention.lower() for mention in MENTION_PATTERN.findall(text or "")}
+    return [handle for handle in handles if handle.lower() not in present]
 
 
 def _normalize_handle_value(handle: Optional[str]) -> Optional[str]:
@@ -259,7 +260,7 @@ class OllamaPlugin(BasePlugin):
                 
         elif self.thinking_tags == 'collapse':
             # Create collapsible format
-            lines = len(thinking_content.split('\n'))
+            lines = thinking_content.count('\n') + 1
             formatted_thinking = f"💭 *[AI Reasoning - {lines} thoughts]* #AIthinking"
             
         else:  # 'show' (default)
@@ -332,10 +333,12 @@ class OllamaPlugin(BasePlugin):
         else:
             formatted_message = message
 
+        # Normalize our own handle once; it is reused for the sender check below
+        agent_handle_normalized: Optional[str] = None
         if agent_name:
-            agent_handle = agent_name if str(agent_name).startswith("@") else f"@{agent_name}"
-            if agent_handle not in formatted_message:
-                formatted_message = f"[For {agent_handle}]\n{formatted_message}"
+            agent_handle_normalized = agent_name if str(agent_name).startswith("@") else f"@{agent_name}"
+            if agent_handle_normalized not in formatted_message:
+                formatted_message = f"[For {agent_handle_normalized}]\n{formatted_message}"
 
         self.messages_history.append({"role": "user", "content": formatted_message})
 
@@ -373,10 +376,6 @@ class OllamaPlugin(BasePlugin):
             except Exception as exc:
                 raise exc
 
-        agent_handle_normalized: Optional[str] = None
-        if agent_name:
-            agent_handle_normalized = agent_name if str(agent_name).startswith('@') else f'@{agent_name}'
-
         if not required_mentions and normalized_sender:
             if not (agent_handle_normalized and normalized_sender.lower() == agent_handle_normalized.lower()):
                 required_mentions.append(normalized_sender)
@@ -406,9 +405,7 @@ class OllamaPlugin(BasePlugin):
             reply = self._process_thinking_tags(reply)
 
             trimmed_reply = reply.strip()
-            missing_mentions = [
-                handle for handle in required_mentions if not _contains_handle(reply, handle)
-            ]
+            missing_mentions = _missing_handles(reply, required_mentions)
             mention_satisfied = not missing_mentions
             hash_opt_out = trimmed_reply.startswith('#')
 
@@ -441,8 +438,9 @@ class OllamaPlugin(BasePlugin):
 
         # Keep conversation history manageable
         if len(self.messages_history) > (self.max_history * 2 + 1):  # system + N exchanges
-            # Keep system message and last N exchanges
-            self.messages_history[1:] = self.messages_history[-(self.max_history * 2):]
+            # Keep system message and last N exchanges; evicting the oldest
+            # entries in place avoids copying the whole window every turn
+            del self.messages_history[1:len(self.messages_history) - self.max_history * 2]
 
         return final_reply
     
@@ -62,14 +62,11 @@ def _normalize_handle(candidate: Optional[str]) -> Optional[str]:
     return None
 
 
-def _contains_handle(text: str, handle: Optional[str]) -> bool:
-    if not text or not handle:
-        return False
-    handle_lower = handle.lower()
-    for mention in MENTION_PATTERN.findall(text):
-        if mention.lower() == handle_lower:
-            return True
-    return False
+def _missing_handles(text: str, handles: list[str]) -> list[str]:
+    if not handles:
+        return []
+    present = {mention.lower() for mention in MENTION_PATTERN.findall(text or "")}
+    return [handle for handle in handles if handle.lower() not in present]
 
 
 def _ensure_sender_prefix(reply: str, sender: Optional[str]) -> str:
@@ -180,10 +177,12 @@ class OpenrouterPlugin(BasePlugin):
         else:
             formatted_message = message
 
+        # Normalize our own handle once; it is reused for the sender check below
+        agent_handle_normalized: Optional[str] = None
         if agent_name:
-            agent_handle = agent_name if str(agent_name).startswith("@") else f"@{agent_name}"
-            if agent_handle not in formatted_message:
-                formatted_message = f"[For {agent_handle}]\n{formatted_message}"
+            agent_handle_normalized = agent_name if str(agent_name).startswith("@") else f"@{agent_name}"
+            if agent_handle_normalized not in formatted_message:
+                formatted_message = f"[For {agent_handle_normalized}]\n{formatted_message}"
 
         if self.messages_history and self.messages_history[0].get("role") == "system":
             history = self.messages_history + [{"role": "user", "content": formatted_message}]
@@ -207,17 +206,11 @@ class OpenrouterPlugin(BasePlugin):
         reply = response.choices[0].message.content if response.choices else ""
         reply = (reply or "").strip()
 
-        agent_handle_normalized: Optional[str] = None
-        if agent_name:
-            agent_handle_normalized = agent_name if str(agent_name).startswith('@') else f'@{agent_name}'
-
         if not required_mentions and normalized_sender:
             if not (agent_handle_normalized and normalized_sender.lower() == agent_handle_normalized.lower()):
                 required_mentions.append(normalized_sender)
 
-        missing_mentions = [
-            handle for handle in required_mentions if not _contains_handle(reply, handle)
-        ]
+        missing_mentions = _missing_handles(reply, required_mentions)
 
         if missing_mentions:
             mention_prefix = " ".join(missing_mentions)
@@ -230,7 +223,8 @@ class OpenrouterPlugin(BasePlugin):
         self.messages_history.append({"role": "assistant", "content": reply})
 
         if len(self.messages_history) > (self.max_history * 2 + 1):
-            self.messages_history[1:] = self.messages_history[-(self.max_history * 2):]
+            # Evict the oldest exchanges in place rather than copying the window
+            del self.messages_history[1:len(self.messages_history) - self.max_history * 2]
 
         return reply
 
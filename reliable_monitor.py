@@ -15,18 +15,27 @@ This monitor implements multiple reliability strategies:
 import os
 import sys
 import json
-import time
+import logging
 import asyncio
 import sqlite3
 import hashlib
+import importlib
 import random
 import re
+import uuid
 from datetime import datetime, timedelta
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+try:
+    from blake3 import blake3
+except ImportError:  # pragma: no cover - optional speedup
+    blake3 = None  # type: ignore[assignment]
+
 # Add parent directory to path for plugins
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.insert(0, 'src')
@@ -34,6 +43,19 @@ sys.path.insert(0, 'src')
 from ax_mcp_wait_client.config_loader import parse_mcp_config, get_default_config_path
 from ax_mcp_wait_client.mcp_client import MCPClient
 
+logger = logging.getLogger("reliable_monitor")
+
+MENTION_LINE_PATTERN = re.compile(r"^[ \t]*[•\-][ \t]*(?P<author>[^:\n]+):[ \t]*(?P<body>[^\n]*)", re.MULTILINE)
+MENTION_HANDLE_PATTERN = re.compile(r"@[0-9A-Za-z_\-]+")
+HANDLE_INVALID_CHARS = re.compile(r"[^0-9A-Za-z_\-]")
+
+@lru_cache(maxsize=None)
+def _plugin_class(plugin_type: str) -> type:
+    """Resolve plugins.<type>_plugin.<Type>Plugin once per plugin type"""
+    module = importlib.import_module(f"plugins.{plugin_type}_plugin")
+    class_name = ''.join(word.capitalize() for word in plugin_type.split('_')) + 'Plugin'
+    return getattr(module, class_name)
+
 class MessageStatus(Enum):
     PENDING = "pending"
     PROCESSING = "processing"
@@ -43,7 +65,7 @@ class MessageStatus(Enum):
 
 @dataclass
 class StoredMessage:
-    id: str
+    id: bytes
     raw_content: str
     parsed_author: Optional[str]
     parsed_mention: Optional[str]
@@ -54,43 +76,75 @@ class StoredMessage:
     retry_count: int
     error_message: Optional[str]
 
+def short_id(message_id: bytes) -> str:
+    """Short printable form of a message ID for log lines"""
+    # Rows written before IDs became binary still carry hex strings
+    if isinstance(message_id, bytes):
+        # Hex-encode only the 4 bytes that are shown
+        return message_id[:4].hex()
+    return message_id[:8]
+
 class ReliableMessageStore:
     """SQLite-based message store with ACID guarantees"""
     
     def __init__(self, db_path: str = "messages.db"):
         self.db_path = db_path
+        # One connection for the life of the monitor; the monitor is a
+        # single-threaded asyncio app so there is only ever one writer.
+        # Autocommit mode: each statement is its own transaction and batches
+        # open one explicitly via _transaction().
+        self._conn = sqlite3.connect(self.db_path, isolation_level=None)
         self._init_db()
     
+    @contextmanager
+    def _transaction(self):
+        """Run a batch of statements in a single explicit transaction"""
+        self._conn.execute("BEGIN")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+    
+    def close(self):
+        """Close the underlying database connection"""
+        self._conn.close()
+    
     def _init_db(self):
         """Initialize database schema"""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS messages (
-                    id TEXT PRIMARY KEY,
-                    raw_content TEXT NOT NULL,
-                    parsed_author TEXT,
-                    parsed_mention TEXT,
-                    sender_handle TEXT,
-                    status TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    processed_at TEXT,
-                    retry_count INTEGER DEFAULT 0,
-                    error_message TEXT
-                )
-            """)
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_status ON messages(status)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_created_at ON messages(created_at)")
-            conn.commit()
-        finally:
-            conn.close()
+        conn = self._conn
+        # WAL + synchronous=NORMAL turns each commit into a single log append
+        # instead of two fsyncs; PRAGMAs are per-connection so set them here.
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS messages (
+                id BLOB PRIMARY KEY,
+                raw_content TEXT NOT NULL,
+                parsed_author TEXT,
+                parsed_mention TEXT,
+                sender_handle TEXT,
+                status TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                processed_at TEXT,
+                retry_count INTEGER DEFAULT 0,
+                error_message TEXT
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_status ON messages(status)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_created_at ON messages(created_at)")
     
     def store_message(self, message: StoredMessage) -> bool:
-        """Store message with ACID guarantee"""
-        conn = sqlite3.connect(self.db_path)
+        """Store a new message; returns False if it is a duplicate or the write fails"""
         try:
-            conn.execute("""
-                INSERT OR REPLACE INTO messages 
+            # The primary key doubles as the durable dedup check
+            cursor = self._conn.execute("""
+                INSERT OR IGNORE INTO messages 
                 (id, raw_content, parsed_author, parsed_mention, sender_handle, 
                  status, created_at, processed_at, retry_count, error_message)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
@@ -106,70 +160,100 @@ class ReliableMessageStore:
                 message.retry_count,
                 message.error_message
             ))
-            conn.commit()
-            return True
+            return cursor.rowcount > 0
         except Exception as e:
-            print(f"❌ Failed to store message: {e}")
+            logger.error("❌ Failed to store message: %s", e)
             return False
-        finally:
-            conn.close()
-    
-    def get_pending_messages(self) -> List[StoredMessage]:
-        """Get all pending messages ordered by creation time"""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.execute("""
-                SELECT * FROM messages 
-                WHERE status IN ('pending', 'failed') 
-                ORDER BY created_at ASC
-            """)
-            messages = []
-            for row in cursor.fetchall():
-                messages.append(self._row_to_message(row))
-            return messages
-        finally:
-            conn.close()
     
-    def update_message_status(self, message_id: str, status: MessageStatus, 
-                            error_message: Optional[str] = None) -> bool:
-        """Update message status atomically"""
-        conn = sqlite3.connect(self.db_path)
+    def finalize_message(self, message: StoredMessage, status: MessageStatus,
+                         error_message: Optional[str] = None,
+                         now: Optional[datetime] = None) -> bool:
+        """Write the message's parsed fields and final status in one UPSERT"""
         try:
-            processed_at = datetime.now() if status in [MessageStatus.COMPLETED, MessageStatus.DEAD_LETTER] else None
-            conn.execute("""
-                UPDATE messages 
-                SET status = ?, processed_at = ?, error_message = ?
-                WHERE id = ?
+            processed_at = (now or datetime.now()) if status in [MessageStatus.COMPLETED, MessageStatus.DEAD_LETTER] else None
+            self._conn.execute("""
+                INSERT INTO messages 
+                (id, raw_content, parsed_author, parsed_mention, sender_handle, 
+                 status, created_at, processed_at, retry_count, error_message)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    parsed_author = excluded.parsed_author,
+                    parsed_mention = excluded.parsed_mention,
+                    sender_handle = excluded.sender_handle,
+                    status = excluded.status,
+                    processed_at = excluded.processed_at,
+                    retry_count = excluded.retry_count,
+                    error_message = excluded.error_message
             """, (
+                message.id,
+                message.raw_content,
+                message.parsed_author,
+                message.parsed_mention,
+                message.sender_handle,
                 status.value,
+                message.created_at.isoformat(),
                 processed_at.isoformat() if processed_at else None,
-                error_message,
-                message_id
+                message.retry_count,
+                error_message
             ))
-            conn.commit()
-            return conn.rowcount > 0
+            message.status = status
+            message.processed_at = processed_at
+            message.error_message = error_message
+            return True
         except Exception as e:
-            print(f"❌ Failed to update message status: {e}")
+            logger.error("❌ Failed to finalize message: %s", e)
             return False
-        finally:
-            conn.close()
     
-    def increment_retry_count(self, message_id: str) -> int:
-        """Increment retry count and return new count"""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            conn.execute("""
+    def get_pending_messages(self) -> List[StoredMessage]:
+        """Get all pending messages ordered by creation time"""
+        cursor = self._conn.execute("""
+            SELECT * FROM messages 
+            WHERE status IN ('pending', 'failed') 
+            ORDER BY created_at ASC
+        """)
+        return [self._row_to_message(row) for row in cursor.fetchall()]
+    
+    def get_retryable_messages(self, max_retries: int) -> List[Tuple[bytes, int, Optional[str]]]:
+        """Return (id, retry_count, processed_at) for failed messages still under the retry limit"""
+        cursor = self._conn.execute("""
+            SELECT id, retry_count, processed_at FROM messages 
+            WHERE status = 'failed' 
+            AND retry_count < ?
+        """, (max_retries,))
+        return cursor.fetchall()
+    
+    def mark_pending(self, message_ids: List[bytes]) -> None:
+        """Move the given messages back to pending in one transaction"""
+        if not message_ids:
+            return
+        with self._transaction() as conn:
+            conn.executemany("""
+                UPDATE messages SET status = 'pending' WHERE id = ?
+            """, [(message_id,) for message_id in message_ids])
+    
+    def dead_letter_messages(self, entries: List[Tuple[bytes, str]], now: datetime) -> None:
+        """Move (message_id, reason) pairs to the dead letter queue in one transaction"""
+        if not entries:
+            return
+        processed_at = now.isoformat()
+        with self._transaction() as conn:
+            conn.executemany("""
                 UPDATE messages 
-                SET retry_count = retry_count + 1
+                SET status = ?, processed_at = ?, error_message = ?
                 WHERE id = ?
-            """, (message_id,))
-            conn.commit()
-            
-            cursor = conn.execute("SELECT retry_count FROM messages WHERE id = ?", (message_id,))
-            row = cursor.fetchone()
-            return row[0] if row else 0
-        finally:
-            conn.close()
+            """, [
+                (MessageStatus.DEAD_LETTER.value, processed_at, reason, message_id)
+                for message_id, reason in entries
+            ])
+    
+    def delete_completed_before(self, cutoff: datetime) -> int:
+        """Delete completed messages processed before cutoff; returns rows deleted"""
+        cursor = self._conn.execute("""
+            DELETE FROM messages 
+            WHERE status IN ('completed') 
+            AND processed_at < ?
+        """, (cutoff.isoformat(),))
+        return cursor.rowcount
     
     def _row_to_message(self, row) -> StoredMessage:
         """Convert database row to StoredMessage"""
@@ -211,9 +295,27 @@ class HealthChecker:
     def __init__(self, client: MCPClient, check_interval: float = 60.0):
         self.client = client
         self.check_interval = check_interval
-        self.last_successful_check = time.time()
         self.consecutive_failures = 0
         self.max_failures = 3
+        self.stale = False
+        self._recent_success = False
+        self._stale_timer: Optional[asyncio.TimerHandle] = None
+        self.mark_success()
+    
+    def mark_success(self):
+        """Record a healthy round-trip and re-arm the staleness timer"""
+        self.consecutive_failures = 0
+        self.stale = False
+        self._recent_success = True
+        if self._stale_timer is not None:
+            self._stale_timer.cancel()
+        # The event loop's timer heap flags staleness; no clock reads per iteration
+        self._stale_timer = asyncio.get_running_loop().call_later(
+            self.check_interval * 2, self._mark_stale
+        )
+    
+    def _mark_stale(self):
+        self.stale = True
     
     async def health_check(self) -> bool:
         """Perform health check"""
@@ -221,30 +323,33 @@ class HealthChecker:
             # Simple health check - try to check messages with reasonable timeout
             result = await self.client.check_messages(wait=False, timeout=300, limit=1)
             if result is not None:
-                self.last_successful_check = time.time()
-                self.consecutive_failures = 0
+                self.mark_success()
                 return True
             else:
                 self.consecutive_failures += 1
                 return False
         except Exception as e:
-            print(f"🩺 Health check failed: {e}")
+            logger.warning("🩺 Health check failed: %s", e)
             self.consecutive_failures += 1
             return False
     
     def is_healthy(self) -> bool:
         """Check if connection is considered healthy"""
-        time_since_last_check = time.time() - self.last_successful_check
-        return (self.consecutive_failures < self.max_failures and 
-                time_since_last_check < self.check_interval * 2)
+        return not self.stale and self.consecutive_failures < self.max_failures
     
     async def run_health_checks(self):
         """Background task for periodic health checks"""
         while True:
             await asyncio.sleep(self.check_interval)
+            if self._recent_success:
+                # A long poll returned during this interval, which already
+                # proves the connection is alive; skip the extra round trip
+                self._recent_success = False
+                continue
             await self.health_check()
+            self._recent_success = False
             if not self.is_healthy():
-                print(f"⚠️ Connection unhealthy - {self.consecutive_failures} consecutive failures")
+                logger.warning("⚠️ Connection unhealthy - %d consecutive failures", self.consecutive_failures)
 
 class ReliableMonitor:
     """99.999% reliable message monitor"""
@@ -268,6 +373,18 @@ class ReliableMonitor:
         self.max_retries = 5
         self.dead_letter_threshold = 10
         self.message_timeout = 300  # 5 minutes
+        self.poll_timeout = 300  # server-side long-poll window
+        self.stall_grace = 30  # extra time before a long poll counts as stalled
+        
+        # Messages are processed in background tasks so the next long poll
+        # starts immediately; plugins keep conversation history, so run them
+        # one at a time unless configured otherwise
+        self.max_concurrency = max(1, int(os.getenv('MONITOR_CONCURRENCY', '1')))
+        self._process_slots = asyncio.Semaphore(self.max_concurrency)
+        self._in_flight: Dict[bytes, asyncio.Task] = {}
+        # Set by a background send that failed; the main loop owns the
+        # connection, so it does the reconnect
+        self._reconnect_requested = False
         
     async def initialize(self):
         """Initialize all components"""
@@ -311,28 +428,22 @@ class ReliableMonitor:
         for attempt in range(max_retries):
             try:
                 await self.client.connect()
-                print("✅ Connected to MCP server")
+                logger.info("✅ Connected to MCP server")
                 return
             except Exception as e:
                 if attempt == max_retries - 1:
                     raise e
                 delay = self.backoff.get_delay(attempt)
-                print(f"⚠️ Connection attempt {attempt + 1} failed: {e}")
-                print(f"🔄 Retrying in {delay:.1f}s...")
+                logger.warning("⚠️ Connection attempt %d failed: %s", attempt + 1, e)
+                logger.info("🔄 Retrying in %.1fs...", delay)
                 await asyncio.sleep(delay)
     
     def _load_plugin(self):
         """Load plugin with error handling"""
-        # Import plugin loading logic from original monitor
-        import importlib
         try:
-            module_name = f"plugins.{self.plugin_type}_plugin"
-            module = importlib.import_module(module_name)
-            class_name = ''.join(word.capitalize() for word in self.plugin_type.split('_')) + 'Plugin'
-            plugin_class = getattr(module, class_name)
-            return plugin_class({})
+            return _plugin_class(self.plugin_type)({})
         except Exception as e:
-            print(f"❌ Failed to load plugin '{self.plugin_type}': {e}")
+            logger.error("❌ Failed to load plugin '%s': %s", self.plugin_type, e)
             raise
     
     async def run(self):
@@ -350,50 +461,61 @@ class ReliableMonitor:
             while True:
                 # Check connection health
                 if not self.health_checker.is_healthy():
-                    print("🔄 Reconnecting due to health check failure...")
+                    logger.warning("🔄 Reconnecting due to health check failure...")
+                    await self._reliable_reconnect()
+                elif self._reconnect_requested:
+                    logger.warning("🔄 Reconnecting after a failed send...")
                     await self._reliable_reconnect()
                 
                 # Process pending messages first
                 await self._process_pending_messages()
                 
-                # Check for new messages
-                await self._check_new_messages()
-                
-                # Brief pause before next iteration
-                await asyncio.sleep(1)
+                # Check for new messages; a fresh arrival is dispatched on the
+                # next pass straight away instead of after the idle pause
+                if not await self._check_new_messages():
+                    # Brief pause before next iteration
+                    await asyncio.sleep(1)
                 
         except KeyboardInterrupt:
             print("\\n👋 Shutting down gracefully...")
         finally:
-            # Cancel background tasks
-            health_task.cancel()
-            retry_task.cancel()
-            cleanup_task.cancel()
+            # Cancel background tasks; interrupted messages stay pending in the store
+            in_flight = list(self._in_flight.values())
+            for task in [health_task, retry_task, cleanup_task, *in_flight]:
+                task.cancel()
             
             # Wait for tasks to complete
-            await asyncio.gather(health_task, retry_task, cleanup_task, return_exceptions=True)
+            await asyncio.gather(health_task, retry_task, cleanup_task, *in_flight, return_exceptions=True)
             
             # Disconnect client
             if self.client:
                 try:
-                    await self.client.disconnect()
+                    await self.client.close()
                 except:
                     pass
+            
+            self.message_store.close()
     
-    async def _check_new_messages(self):
-        """Check for new messages with reliability"""
+    async def _check_new_messages(self) -> bool:
+        """Check for new messages with reliability; True if a new one was stored"""
         try:
-            # Use reasonable timeout for message checking
-            messages = await self.client.check_messages(wait=True, timeout=300, limit=5)
+            # Use reasonable timeout for message checking; a call that outlives
+            # the server's own long-poll window has stalled, and the client
+            # reconnects itself within this task
+            messages = await self.client.check_messages(
+                wait=True,
+                timeout=self.poll_timeout,
+                limit=5,
+                stall_timeout=self.poll_timeout + self.stall_grace,
+            )
+            if messages is not None:
+                self.health_checker.mark_success()
             
             if messages and '✅ WAIT SUCCESS' in messages:
                 message_id = self._generate_message_id(messages)
                 
-                # Check if we've already processed this message
-                if self._is_duplicate_message(message_id):
-                    return
-                
-                # Store raw message immediately for persistence
+                # Store raw message immediately for persistence; duplicates are
+                # rejected by the primary key rather than a separate lookup
                 stored_message = StoredMessage(
                     id=message_id,
                     raw_content=messages,
@@ -408,63 +530,72 @@ class ReliableMonitor:
                 )
                 
                 if self.message_store.store_message(stored_message):
-                    print(f"📥 New message stored: {message_id[:8]}...")
-                else:
-                    print(f"❌ Failed to store message: {message_id[:8]}...")
+                    logger.info("📥 New message stored: %s...", short_id(message_id))
+                    return True
                     
-        except asyncio.TimeoutError:
-            # Timeout is expected in polling mode
-            pass
         except Exception as e:
-            print(f"⚠️ Error checking messages: {e}")
+            logger.warning("⚠️ Error checking messages: %s", e)
             await asyncio.sleep(5)
+        return False
     
     async def _process_pending_messages(self):
         """Process all pending messages"""
         pending_messages = self.message_store.get_pending_messages()
+        now = datetime.now()
+        dead_letters: List[Tuple[bytes, str]] = []
+        ready: List[StoredMessage] = []
         
         for message in pending_messages:
+            if message.id in self._in_flight:
+                # Already queued or running from an earlier sweep
+                continue
+            
             if message.retry_count >= self.max_retries:
                 # Move to dead letter queue
-                self.message_store.update_message_status(
-                    message.id, 
-                    MessageStatus.DEAD_LETTER,
-                    f"Exceeded max retries ({self.max_retries})"
-                )
-                print(f"💀 Message moved to dead letter queue: {message.id[:8]}...")
+                dead_letters.append((message.id, f"Exceeded max retries ({self.max_retries})"))
+                logger.warning("💀 Message moved to dead letter queue: %s...", short_id(message.id))
                 continue
             
             # Check if message is too old
-            age = datetime.now() - message.created_at
+            age = now - message.created_at
             if age.total_seconds() > self.message_timeout:
-                self.message_store.update_message_status(
-                    message.id,
-                    MessageStatus.DEAD_LETTER,
-                    f"Message timeout ({self.message_timeout}s)"
-                )
-                print(f"⏰ Message expired: {message.id[:8]}...")
+                dead_letters.append((message.id, f"Message timeout ({self.message_timeout}s)"))
+                logger.warning("⏰ Message expired: %s...", short_id(message.id))
                 continue
             
-            # Process the message
+            ready.append(message)
+        
+        # One transaction for the whole sweep's dead letters
+        self.message_store.dead_letter_messages(dead_letters, now)
+        
+        for message in ready:
+            # Hand off to a background task; the slot semaphore bounds concurrency
+            task = asyncio.create_task(self._process_in_slot(message))
+            self._in_flight[message.id] = task
+            task.add_done_callback(lambda _task, message_id=message.id: self._in_flight.pop(message_id, None))
+    
+    async def _process_in_slot(self, message: StoredMessage):
+        """Process a message once a processing slot is free"""
+        async with self._process_slots:
             await self._process_single_message(message)
     
     async def _process_single_message(self, message: StoredMessage):
         """Process a single message with error handling"""
+        # Parsing and the outcome are written together by finalize_message, so
+        # each attempt costs one commit. A crash mid-attempt leaves the row
+        # pending/failed, which the next sweep picks up again.
         try:
-            # Mark as processing
-            self.message_store.update_message_status(message.id, MessageStatus.PROCESSING)
-            
             # Parse the message if not already parsed
             if not message.parsed_mention:
                 parsed_author, parsed_mention, sender_handle = self._parse_message(message.raw_content)
                 message.parsed_author = parsed_author
                 message.parsed_mention = parsed_mention
                 message.sender_handle = sender_handle
-                self.message_store.store_message(message)
             
-            # Check if this message mentions our agent
-            if not self._is_mention_for_us(message.parsed_mention or ""):
-                self.message_store.update_message_status(message.id, MessageStatus.COMPLETED, "Not a mention for this agent")
+            # _parse_message only returns a mention line that contains our
+            # handle, so no second scan of the text is needed here
+            if not message.parsed_mention:
+                self.message_store.finalize_message(message, MessageStatus.COMPLETED, "Not a mention for this agent")
                 return
             
             # Process with plugin
@@ -473,50 +604,42 @@ class ReliableMonitor:
             
             # Send response with retries
             if await self._send_response_reliably(response):
-                self.message_store.update_message_status(message.id, MessageStatus.COMPLETED)
-                print(f"✅ Message processed successfully: {message.id[:8]}...")
+                self.message_store.finalize_message(message, MessageStatus.COMPLETED)
+                logger.info("✅ Message processed successfully: %s...", short_id(message.id))
             else:
                 # Increment retry count and mark as failed for retry
-                retry_count = self.message_store.increment_retry_count(message.id)
-                self.message_store.update_message_status(message.id, MessageStatus.FAILED, "Failed to send response")
+                message.retry_count += 1
+                self.message_store.finalize_message(message, MessageStatus.FAILED, "Failed to send response")
                 
-                delay = self.backoff.get_delay(retry_count)
-                print(f"❌ Failed to send response, will retry in {delay:.1f}s (attempt {retry_count})")
+                delay = self.backoff.get_delay(message.retry_count)
+                logger.error("❌ Failed to send response, will retry in %.1fs (attempt %d)", delay, message.retry_count)
                 
         except Exception as e:
-            retry_count = self.message_store.increment_retry_count(message.id)
-            self.message_store.update_message_status(message.id, MessageStatus.FAILED, str(e))
-            print(f"❌ Error processing message {message.id[:8]}: {e}")
+            message.retry_count += 1
+            self.message_store.finalize_message(message, MessageStatus.FAILED, str(e))
+            logger.error("❌ Error processing message %s: %s", short_id(message.id), e)
     
     def _parse_message(self, raw_content: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """Parse message with multiple strategies for reliability"""
-        import re
+        text = raw_content.replace('\\n', '\n')
         
-        # Strategy 1: Original regex pattern
-        MENTION_LINE_PATTERN = re.compile(r"^[•\\-]\\s*(?P<author>[^:]+):\\s*(?P<body>.*)$")
-        MENTION_HANDLE_PATTERN = re.compile(r"@[0-9A-Za-z_\\-]+")
-        
-        lines = raw_content.replace('\\\\n', '\\n').split('\\n')
-        
-        for line in lines:
-            stripped = line.strip()
-            if not stripped or stripped.startswith('✅') or stripped.startswith('📨'):
-                continue
-                
-            match = MENTION_LINE_PATTERN.match(stripped)
-            if match:
-                author = match.group('author').strip()
-                body = match.group('body')
-                
-                # Check if our agent is mentioned
-                mentions = MENTION_HANDLE_PATTERN.findall(f"{author}: {body}")
-                if any(m.lower() == self.agent_handle_lower for m in mentions):
-                    sender_handle = self._extract_sender_handle(author)
-                    return author, f"• {author}: {body}", sender_handle
+        # Strategy 1: bullet lines ("• author: body"), matched in one pass
+        for match in MENTION_LINE_PATTERN.finditer(text):
+            author = match.group('author').strip()
+            body = match.group('body').rstrip()
+            
+            # Check if our agent is mentioned
+            mentions = MENTION_HANDLE_PATTERN.findall(f"{author}: {body}")
+            if any(m.lower() == self.agent_handle_lower for m in mentions):
+                sender_handle = self._extract_sender_handle(author)
+                return author, f"• {author}: {body}", sender_handle
         
         # Strategy 2: Fallback - look for any line with our agent handle
-        for line in lines:
-            if self.agent_handle_lower in line.lower():
+        lowered_text = text.lower()
+        if self.agent_handle_lower not in lowered_text:
+            return None, None, None
+        for line, lowered in zip(text.split('\n'), lowered_text.split('\n')):
+            if self.agent_handle_lower in lowered:
                 mentions = MENTION_HANDLE_PATTERN.findall(line)
                 if any(m.lower() == self.agent_handle_lower for m in mentions):
                     # Try to extract author from line
@@ -530,10 +653,6 @@ class ReliableMonitor:
     
     def _extract_sender_handle(self, author_text: str) -> str:
         """Extract sender handle from author text"""
-        import re
-        
-        MENTION_HANDLE_PATTERN = re.compile(r"@[0-9A-Za-z_\\-]+")
-        
         # Look for @handle in author text
         match = MENTION_HANDLE_PATTERN.search(author_text)
         if match:
@@ -547,16 +666,12 @@ class ReliableMonitor:
             parts = base.split()
             base = parts[0] if parts else ""
             base = base.strip('@,:')
-            base = re.sub(r'[^0-9A-Za-z_\\-]', '', base)
+            base = HANDLE_INVALID_CHARS.sub('', base)
             if base:
                 return f"@{base}"
         
         return "@unknown"
     
-    def _is_mention_for_us(self, mention: str) -> bool:
-        """Check if mention is for our agent"""
-        return self.agent_handle_lower in mention.lower()
-    
     async def _process_with_plugin(self, message: StoredMessage) -> str:
         """Process message with plugin"""
         plugin_context = {
@@ -583,9 +698,9 @@ class ReliableMonitor:
 
         if self._self_handle_pattern.search(response.lower()):
             self.self_mention_violation_count += 1
-            print(
-                "⚠️  Protocol violation: self-mention detected in response "
-                f"(count={self.self_mention_violation_count})."
+            logger.warning(
+                "⚠️  Protocol violation: self-mention detected in response (count=%d).",
+                self.self_mention_violation_count,
             )
             sanitized_response = self._self_handle_pattern.sub("[self-mention-blocked]", response)
             penalty_note = (
@@ -600,19 +715,26 @@ class ReliableMonitor:
     
     async def _send_response_reliably(self, response: str, max_attempts: int = 3) -> bool:
         """Send response with retry logic"""
+        # This runs in a processing task, not the task that connected the
+        # client, so a failed send must not disconnect or reconnect here;
+        # it flags the main loop to do it instead. One key across attempts
+        # lets the server drop a retry of a send that did arrive.
+        idempotency_key = str(uuid.uuid4())
         for attempt in range(max_attempts):
             try:
-                if await self.client.send_message(response):
+                if await self.client.send_message(response, idempotency_key=idempotency_key, reconnect=False):
                     return True
             except Exception as e:
-                print(f"❌ Send attempt {attempt + 1} failed: {e}")
-                if attempt < max_attempts - 1:
-                    await asyncio.sleep(self.backoff.get_delay(attempt))
+                logger.error("❌ Send attempt %d failed: %s", attempt + 1, e)
+            self._reconnect_requested = True
+            if attempt < max_attempts - 1:
+                await asyncio.sleep(self.backoff.get_delay(attempt))
         
         return False
     
     async def _reliable_reconnect(self):
         """Reconnect with exponential backoff"""
+        self._reconnect_requested = False
         try:
             await self.client.disconnect()
         except:
@@ -621,21 +743,19 @@ class ReliableMonitor:
         await self._reliable_connect()
         
         # Update health checker
-        self.health_checker.last_successful_check = time.time()
-        self.health_checker.consecutive_failures = 0
-    
-    def _generate_message_id(self, content: str) -> str:
-        """Generate unique ID for message content"""
-        return hashlib.sha256(f"{content}:{time.time()}".encode()).hexdigest()
+        self.health_checker.mark_success()
     
-    def _is_duplicate_message(self, message_id: str) -> bool:
-        """Check if message has already been processed"""
-        conn = sqlite3.connect(self.message_store.db_path)
-        try:
-            cursor = conn.execute("SELECT id FROM messages WHERE id = ?", (message_id,))
-            return cursor.fetchone() is not None
-        finally:
-            conn.close()
+    def _generate_message_id(self, content: str) -> bytes:
+        """Derive a stable ID from the payload so redeliveries share it"""
+        # Only the payload is hashed (it carries the sender, and the server's
+        # [id:...] tag when present), never a clock reading, so a redelivered
+        # payload maps to the same primary key and INSERT OR IGNORE drops it.
+        # 16 raw bytes keep the primary key index half the size of 64-char hex;
+        # blake3 (SIMD) or blake2b emit them directly, both faster than sha256
+        data = content.encode()
+        if blake3 is not None:
+            return blake3(data).digest(length=16)
+        return hashlib.blake2b(data, digest_size=16).digest()
     
     async def _retry_failed_messages(self):
         """Background task to retry failed messages"""
@@ -643,38 +763,23 @@ class ReliableMonitor:
             await asyncio.sleep(30)  # Check every 30 seconds
             
             # Get failed messages ready for retry
-            conn = sqlite3.connect(self.message_store.db_path)
-            try:
-                cursor = conn.execute("""
-                    SELECT id, retry_count FROM messages 
-                    WHERE status = 'failed' 
-                    AND retry_count < ?
-                """, (self.max_retries,))
+            failed_messages = self.message_store.get_retryable_messages(self.max_retries)
+            now = datetime.now()
+            ready = []
+            
+            for message_id, retry_count, processed_at in failed_messages:
+                delay = self.backoff.get_delay(retry_count)
                 
-                failed_messages = cursor.fetchall()
+                # Check if enough time has passed for retry
+                if processed_at:
+                    last_attempt = datetime.fromisoformat(processed_at)
+                    if now - last_attempt < timedelta(seconds=delay):
+                        continue
                 
-                for message_id, retry_count in failed_messages:
-                    delay = self.backoff.get_delay(retry_count)
-                    
-                    # Check if enough time has passed for retry
-                    cursor = conn.execute("""
-                        SELECT processed_at FROM messages WHERE id = ?
-                    """, (message_id,))
-                    
-                    row = cursor.fetchone()
-                    if row and row[0]:
-                        last_attempt = datetime.fromisoformat(row[0])
-                        if datetime.now() - last_attempt < timedelta(seconds=delay):
-                            continue
-                    
-                    # Mark as pending for retry
-                    conn.execute("""
-                        UPDATE messages SET status = 'pending' WHERE id = ?
-                    """, (message_id,))
-                    
-                conn.commit()
-            finally:
-                conn.close()
+                ready.append(message_id)
+            
+            # Mark as pending for retry
+            self.message_store.mark_pending(ready)
     
     async def _cleanup_old_messages(self):
         """Background task to cleanup old processed messages"""
@@ -683,23 +788,10 @@ class ReliableMonitor:
             
             # Delete completed messages older than 24 hours
             cutoff = datetime.now() - timedelta(hours=24)
+            deleted = self.message_store.delete_completed_before(cutoff)
             
-            conn = sqlite3.connect(self.message_store.db_path)
-            try:
-                conn.execute("""
-                    DELETE FROM messages 
-                    WHERE status IN ('completed') 
-                    AND processed_at < ?
-                """, (cutoff.isoformat(),))
-                
-                deleted = conn.rowcount
-                conn.commit()
-                
-                if deleted > 0:
-                    print(f"🧹 Cleaned up {deleted} old messages")
-                    
-            finally:
-                conn.close()
+            if deleted > 0:
+                logger.info("🧹 Cleaned up %d old messages", deleted)
 
 async def main():
     """Main entry point"""
@@ -710,6 +802,9 @@ async def main():
     await monitor.run()
 
 if __name__ == "__main__":
+    # Third-party loggers stay at WARNING; our own progress lines are INFO
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    logger.setLevel(logging.INFO)
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -4,19 +4,22 @@ import argparse
 import asyncio
 import json
 import time
-from datetime import datetime
+from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Iterable, Iterator, List, Tuple
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 
 from .config import CandidateConfig, DatasetConfig, EvalRunConfig, JudgeConfig
 from .metrics import Verdict, confidence_ok
 from .parsers import parse_verdict
 from .templates import build_judge_prompt, resolve_template
-from . import io
+from . import io, serialization
 from .utils import build_summary_message, maybe_create_announcer
 
 DEFAULT_OUTPUT_BASE = Path("logs/evaluations")
 SUPPORTED_JSON_KEYS = ("prompt", "input", "question", "task")
+RESULTS_FLUSH_EVERY = 10
+LOW_CONFIDENCE_RETRY_NOTE = "\n\nRe-evaluate carefully. The previous answer was uncertain."
 
 
 def parse_args() -> argparse.Namespace:
@@ -39,42 +42,58 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def load_prompts(dataset_path: Path) -> List[str]:
+def _iter_jsonl_prompts(dataset_path: Path) -> Iterator[str]:
+    found = False
+    with dataset_path.open("rb") as fh:
+        for line in fh:
+            # JSON parsers tolerate surrounding whitespace, so skip the strip() copy.
+            if line.isspace():
+                continue
+            try:
+                payload = serialization.loads(line)
+            except json.JSONDecodeError:
+                continue
+            for key in SUPPORTED_JSON_KEYS:
+                if key in payload and payload[key]:
+                    found = True
+                    yield str(payload[key])
+                    break
+    if not found:
+        raise ValueError(f"No prompts found in JSONL file {dataset_path}")
+
+
+def _iter_text_prompts(dataset_path: Path) -> Iterator[str]:
+    found = False
+    with dataset_path.open("r", encoding="utf-8") as fh:
+        for line in fh:
+            prompt = line.strip()
+            if prompt:
+                found = True
+                yield prompt
+    if not found:
+        raise ValueError(f"No prompts found in text file {dataset_path}")
+
+
+def load_prompts(dataset_path: Path) -> Iterator[str]:
+    """Lazily yield prompts from a JSONL or newline-delimited text dataset."""
+
     if not dataset_path.exists():
         raise FileNotFoundError(f"Dataset file not found: {dataset_path}")
     if dataset_path.suffix.lower() in {".jsonl", ".ndjson"}:
-        prompts: List[str] = []
-        with dataset_path.open("r", encoding="utf-8") as fh:
-            for line in fh:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    payload = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                for key in SUPPORTED_JSON_KEYS:
-                    if key in payload and payload[key]:
-                        prompts.append(str(payload[key]))
-                        break
-        if not prompts:
-            raise ValueError(f"No prompts found in JSONL file {dataset_path}")
-        return prompts
+        return _iter_jsonl_prompts(dataset_path)
     # Fallback: treat file as newline-delimited prompts
-    with dataset_path.open("r", encoding="utf-8") as fh:
-        prompts = [line.strip() for line in fh if line.strip()]
-    if not prompts:
-        raise ValueError(f"No prompts found in text file {dataset_path}")
-    return prompts
+    return _iter_text_prompts(dataset_path)
 
 
 def build_run_config(args: argparse.Namespace) -> EvalRunConfig:
     if not args.prompt and not args.dataset:
         raise ValueError("Provide --prompt or --dataset to evaluate.")
 
+    max_samples = max(1, args.max_samples)
     if args.dataset:
         dataset_path = Path(args.dataset).expanduser().resolve()
-        prompts = load_prompts(dataset_path)
+        # Only parse as many lines as the run will actually evaluate.
+        prompts = list(islice(load_prompts(dataset_path), max_samples))
         dataset = DatasetConfig(path=dataset_path, prompts=prompts)
     else:
         dataset = DatasetConfig.from_prompts([args.prompt])
@@ -91,7 +110,7 @@ def build_run_config(args: argparse.Namespace) -> EvalRunConfig:
         judge=judge,
         dataset=dataset,
         template=args.template,
-        max_samples=max(1, args.max_samples),
+        max_samples=max_samples,
         output_dir=output_dir,
         session_tags=list(dict.fromkeys(tag.strip() for tag in args.tag if tag.strip())),
         confidence_threshold=max(0.0, min(1.0, args.confidence_threshold)),
@@ -100,23 +119,20 @@ def build_run_config(args: argparse.Namespace) -> EvalRunConfig:
 
 
 def iter_samples(config: EvalRunConfig) -> Iterator[Tuple[int, str]]:
-    for idx, prompt in enumerate(config.dataset.prompts):
-        if idx >= config.max_samples:
-            break
-        yield idx, prompt
+    yield from enumerate(islice(config.dataset.prompts, config.max_samples))
 
 
 async def evaluate_sample(
     sample_id: int,
     prompt: str,
     config: EvalRunConfig,
-    template: dict,
+    template: Mapping[str, Any],
 ) -> dict:
     response_a = await io.generate_candidate_response(prompt, config.candidate_a)
     response_b = await io.generate_candidate_response(prompt, config.candidate_b)
 
     rubric = template.get("judge_prompt_rubric", "")
-    extra = template.get("extra_instructions", [])
+    extra = template.get("extra_instructions", ())
     judge_prompt = build_judge_prompt(
         prompt,
         response_a,
@@ -130,14 +146,8 @@ async def evaluate_sample(
     verdict = parse_verdict(judge_raw)
 
     if config.low_confidence_retry and not confidence_ok(verdict, config.confidence_threshold):
-        retry_prompt = build_judge_prompt(
-            prompt,
-            response_a,
-            response_b,
-            rubric=rubric,
-            extra=list(extra) + ["Re-evaluate carefully. The previous answer was uncertain."],
-            tags=config.session_tags,
-        )
+        # Reuse the original prompt rather than rebuilding it around both responses again.
+        retry_prompt = judge_prompt + LOW_CONFIDENCE_RETRY_NOTE
         judge_raw = await io.generate_judge_response(retry_prompt, config.judge)
         verdict = parse_verdict(judge_raw)
 
@@ -158,18 +168,35 @@ async def evaluate_sample(
     return record
 
 
+def reuse_duplicate(original: Optional[dict], sample_id: int) -> Optional[dict]:
+    """Clone the record of an identical, already-evaluated prompt for ``sample_id``."""
+
+    if original is None:
+        return None
+    return {
+        **original,
+        "sample_id": sample_id,
+        "duplicate_of": original["sample_id"],
+        "timestamp": time.time(),
+    }
+
+
 def write_json(path: Path, payload: dict) -> None:
-    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    path.write_bytes(serialization.dumps_pretty(payload))
 
 
 def append_jsonl(path: Path, payload: dict) -> None:
-    with path.open("a", encoding="utf-8") as fh:
-        fh.write(json.dumps(payload, ensure_ascii=False) + "\n")
+    with path.open("ab") as fh:
+        write_jsonl_record(fh, payload)
+
+
+def write_jsonl_record(fh: BinaryIO, payload: dict) -> None:
+    fh.write(serialization.dumps_line(payload))
 
 
 async def run(config: EvalRunConfig) -> tuple[Path, dict]:
     template = resolve_template(config.template)
-    timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
     run_dir = config.ensure_output_dir() / f"{timestamp}_{config.template}"
     run_dir.mkdir(parents=True, exist_ok=True)
 
@@ -185,15 +212,26 @@ async def run(config: EvalRunConfig) -> tuple[Path, dict]:
 
     results_path = run_dir / "results.jsonl"
     wins = {"A": 0, "B": 0}
-    announcer = await maybe_create_announcer(run_dir, config)
+    # Keep one handle open for the whole run; periodic flushes bound what a crash can lose.
+    # It is opened before the announcer so a failed open leaves no client to close.
+    results_fh = results_path.open("ab")
+    announcer = None
 
     try:
+        announcer = await maybe_create_announcer(run_dir, config)
         if announcer:
             await announcer.send_start()
 
+        evaluated: Dict[str, dict] = {}
         for sample_id, prompt in iter_samples(config):
-            record = await evaluate_sample(sample_id, prompt, config, template)
-            append_jsonl(results_path, record)
+            prompt_key = serialization.fingerprint(prompt)
+            record = reuse_duplicate(evaluated.get(prompt_key), sample_id)
+            if record is None:
+                record = await evaluate_sample(sample_id, prompt, config, template)
+                evaluated[prompt_key] = record
+            write_jsonl_record(results_fh, record)
+            if (sample_id + 1) % RESULTS_FLUSH_EVERY == 0:
+                results_fh.flush()
             summary["records"].append(record["verdict"])
 
             winner = record["verdict"]["winner"]
@@ -226,6 +264,7 @@ async def run(config: EvalRunConfig) -> tuple[Path, dict]:
 
         return run_dir, summary
     finally:
+        results_fh.close()
         if announcer:
             await announcer.close()
 
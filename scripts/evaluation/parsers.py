@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import json
 import re
 from typing import Any
 
 from .metrics import Verdict
+from .serialization import loads
 
 _JSON_BLOCK = re.compile(r"\{.*\}", re.DOTALL)
 
@@ -23,11 +23,21 @@ def extract_json_block(text: str) -> str:
 def parse_verdict(text: str) -> Verdict:
     """Parse a verdict from the judge output."""
 
-    try:
-        block = extract_json_block(text)
-        data: Any = json.loads(block)
-    except Exception:
-        return Verdict("UNCERTAIN", 0.0, text.strip())
+    stripped = text.strip()
+    data: Any = None
+    # Fast path: a judge that follows instructions returns nothing but the JSON object.
+    if stripped.startswith("{"):
+        try:
+            data = loads(stripped)
+        except ValueError:
+            data = None
+    if not isinstance(data, dict):
+        try:
+            data = loads(extract_json_block(text))
+        except Exception:
+            return Verdict("UNCERTAIN", 0.0, stripped)
+        if not isinstance(data, dict):
+            return Verdict("UNCERTAIN", 0.0, stripped)
 
     winner = str(data.get("winner", "UNCERTAIN")).strip().upper()
     if winner not in {"A", "B", "TIE", "UNCERTAIN"}:
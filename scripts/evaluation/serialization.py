@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps_line(payload: Any) -> bytes:
+    """Serialize ``payload`` as a single UTF-8 JSONL line (newline included)."""
+
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def dumps_pretty(payload: Any) -> bytes:
+    """Serialize ``payload`` as indented UTF-8 JSON with a trailing newline."""
+
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(payload, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON text; failures raise ``json.JSONDecodeError`` with either backend."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def fingerprint(obj: Any) -> str:
+    """Return a short, stable hex digest for cache and dedupe keys.
+
+    Strings are hashed directly; other values are hashed via sorted-key JSON.
+    Digests are only comparable within a single JSON backend.
+    """
+
+    if isinstance(obj, str):
+        data = obj.encode("utf-8")
+    elif orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    else:
+        data = json.dumps(obj, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Iterable, List, Mapping, Optional
 
 DEFAULT_CANDIDATE_SYSTEM_PROMPT = (
     "You are an autonomous agent participating in a head-to-head evaluation. "
@@ -16,18 +18,28 @@ DEFAULT_JUDGE_SYSTEM_PROMPT = (
 PAIRWISE_RUBRIC = (
     "Score responses on usefulness, factual accuracy, and clarity. If neither answer is satisfactory, "
     "choose UNCERTAIN with a low confidence value."
+).strip()
+
+JUDGE_RESPONSE_FORMAT = (
+    "Return a JSON object: {\"winner\": \"A|B|TIE|UNCERTAIN\", \"confidence\": <0-1>, \"reason\": <short explanation>}"
 )
 
-TEMPLATE_REGISTRY = {
-    "pairwise_basic": {
-        "name": "Pairwise Comparison",
-        "judge_prompt_rubric": PAIRWISE_RUBRIC,
-        "extra_instructions": [],
-    },
-}
+# Templates are read-only and shared across samples, so rubrics are stored pre-stripped.
+TEMPLATE_REGISTRY: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {
+        "pairwise_basic": MappingProxyType(
+            {
+                "name": "Pairwise Comparison",
+                "judge_prompt_rubric": PAIRWISE_RUBRIC,
+                "extra_instructions": (),
+            }
+        ),
+    }
+)
 
 
-def resolve_template(key: str) -> dict:
+@lru_cache(maxsize=None)
+def resolve_template(key: str) -> Mapping[str, Any]:
     if key not in TEMPLATE_REGISTRY:
         raise KeyError(f"Unknown evaluation template '{key}'.")
     return TEMPLATE_REGISTRY[key]
@@ -42,20 +54,19 @@ def build_judge_prompt(
     extra: Optional[Iterable[str]] = None,
     tags: Optional[Iterable[str]] = None,
 ) -> str:
-    sections: List[str] = []
-    if tags:
-        sections.append(f"[session_tags: {', '.join(tags)}]")
-
-    sections.append("Task:\n" + task.strip())
-    sections.append("Candidate A:\n" + response_a.strip())
-    sections.append("Candidate B:\n" + response_b.strip())
-
-    rubric_lines = ["Rubric:", rubric.strip()]
+    # ``rubric`` is expected to be pre-stripped (see TEMPLATE_REGISTRY).
+    rubric_block = rubric
     if extra:
-        rubric_lines.extend(instr.strip() for instr in extra if instr)
-    sections.append("\n".join(rubric_lines))
+        extra_lines = "\n".join(instr.strip() for instr in extra if instr)
+        if extra_lines:
+            rubric_block = f"{rubric_block}\n{extra_lines}"
 
-    sections.append(
-        "Return a JSON object: {\"winner\": \"A|B|TIE|UNCERTAIN\", \"confidence\": <0-1>, \"reason\": <short explanation>}"
-    )
-    return "\n\n".join(sections)
+    parts: List[str] = [f"[session_tags: {', '.join(tags)}]"] if tags else []
+    parts += [
+        f"Task:\n{task.strip()}",
+        f"Candidate A:\n{response_a.strip()}",
+        f"Candidate B:\n{response_b.strip()}",
+        f"Rubric:\n{rubric_block}",
+        JUDGE_RESPONSE_FORMAT,
+    ]
+    return "\n\n".join(parts)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+import time
 from pathlib import Path
 from typing import Any, Mapping, Optional, TYPE_CHECKING
 
@@ -10,6 +12,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+PROGRESS_FLUSH_INTERVAL = 1.0
+PROGRESS_BATCH_SIZE = 5
+
 
 def build_summary_message(summary: Mapping[str, Any], run_dir: Path) -> str:
     template = summary.get("template", "pairwise")
@@ -46,6 +51,10 @@ class AxAnnouncer:
         self._enabled = True
         self._tags_line = " ".join(tag for tag in config.session_tags if tag)
         self._expected = max(1, config.max_samples)
+        self._pending: list[str] = []
+        self._last_flush = 0.0
+        self._send_lock = asyncio.Lock()
+        self._inflight: set[asyncio.Task[None]] = set()
 
     @classmethod
     async def create(cls, run_dir: Path, config: "EvalRunConfig") -> Optional["AxAnnouncer"]:
@@ -79,10 +88,11 @@ class AxAnnouncer:
         return cls(client, config, run_dir)
 
     async def close(self) -> None:
+        await self._drain()
         if not self._enabled:
             return
         try:
-            await self._client.disconnect()
+            await self._client.close()
         except Exception:
             pass
 
@@ -115,10 +125,7 @@ class AxAnnouncer:
         reason = verdict.get("reason") or ""
         prompt = record.get("prompt", "")
 
-        lines = self._baseline_lines()
-        lines.append(
-            f"🎯 Sample {sample_id + 1}/{self._expected}: winner={winner} (conf={confidence:.2f})"
-        )
+        lines = [f"🎯 Sample {sample_id + 1}/{self._expected}: winner={winner} (conf={confidence:.2f})"]
 
         if reason:
             lines.append(f"Reason: {self._clip(reason)}")
@@ -130,34 +137,65 @@ class AxAnnouncer:
         if uncertain:
             score_line += f" • Uncertain:{uncertain}"
         lines.append(score_line + f" (judge: {self._config.judge.model})")
-        lines.append(f"Results: {self._results_path}")
 
-        await self._send("\n".join(lines))
+        # Coalesce updates so the evaluation loop never waits on an aX round trip.
+        self._pending.append("\n".join(lines))
+        if (
+            len(self._pending) >= PROGRESS_BATCH_SIZE
+            or time.monotonic() - self._last_flush >= PROGRESS_FLUSH_INTERVAL
+        ):
+            self._flush_pending()
 
     async def send_final(self, summary: Mapping[str, Any]) -> None:
+        await self._drain()
         message = build_summary_message(summary, self._run_dir)
         await self._send(message)
 
     async def send_error(self, error: str) -> None:
+        await self._drain()
         lines = self._baseline_lines()
         lines.append("⚠️ Evaluation aborted")
         lines.append(self._clip(error))
         await self._send("\n".join(lines))
 
+    def _flush_pending(self) -> None:
+        """Send queued progress updates as one message in a background task."""
+
+        if not self._pending:
+            return
+        lines = self._baseline_lines()
+        lines.append("\n\n".join(self._pending))
+        lines.append(f"Results: {self._results_path}")
+        self._pending.clear()
+        self._last_flush = time.monotonic()
+
+        task = asyncio.create_task(self._send("\n".join(lines)))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _drain(self) -> None:
+        self._flush_pending()
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
     async def _send(self, message: str) -> None:
         if not self._enabled or not message.strip():
             return
-        try:
-            ok = await self._client.send_message(message)
-        except Exception as exc:
-            self._enabled = False
-            logger.warning("Failed to send evaluation update to aX: %s", exc)
-            print("⚠️  Failed to send evaluation update to aX; streaming disabled.")
-            return
-        if not ok:
-            self._enabled = False
-            logger.warning("aX message send reported failure; disabling further streaming.")
-            print("⚠️  aX declined evaluation update; streaming disabled.")
+        # asyncio.Lock wakes waiters in FIFO order, so batches arrive in sequence.
+        async with self._send_lock:
+            if not self._enabled:
+                return
+            try:
+                ok = await self._client.send_message(message)
+            except Exception as exc:
+                self._enabled = False
+                logger.warning("Failed to send evaluation update to aX: %s", exc)
+                print("⚠️  Failed to send evaluation update to aX; streaming disabled.")
+                return
+            if not ok:
+                self._enabled = False
+                logger.warning("aX message send reported failure; disabling further streaming.")
+                print("⚠️  aX declined evaluation update; streaming disabled.")
 
     def _baseline_lines(self) -> list[str]:
         lines: list[str] = []
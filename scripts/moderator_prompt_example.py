@@ -16,8 +16,11 @@ import asyncio
 import importlib
 import json
 import os
+import re
 import sys
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
@@ -30,6 +33,21 @@ from ax_mcp_wait_client.mcp_client import MCPClient
 REPO_ROOT = Path(__file__).resolve().parents[1]
 CONFIG_PATH = REPO_ROOT / "configs" / "conversation_templates.json"
 
+# Connected clients keyed by (server_url, agent_name), reused across sends
+_AX_CLIENTS: Dict[tuple[str, str], MCPClient] = {}
+
+# Fixed skeleton of the moderator instruction; only the optional lines vary per call
+_MODERATOR_TEMPLATE = (
+    "Moderator kickoff for {initiator}:\n"
+    "- You are about to chat with {responder} in the '{name}' scenario.\n"
+    "- Mention the responder in your first sentence and keep the reply under 200 words.\n"
+    "- Stay on-theme and sound natural—no reference to this moderator note.{extras}\n"
+    "Now craft the opening message you would post on aX."
+)
+
+_TAG_TOKEN = re.compile(r"#[\w-]+")
+_PLACEHOLDER_RE = re.compile(r"\{(initiator|responder|player1|player2)_(handle|name)\}")
+
 # Ensure we can import plugins.* modules relative to the repo root
 if str(REPO_ROOT) not in sys.path:
     sys.path.append(str(REPO_ROOT))
@@ -37,12 +55,39 @@ if str(REPO_ROOT / "src") not in sys.path:
     sys.path.append(str(REPO_ROOT / "src"))
 
 
+@dataclass(frozen=True, slots=True)
+class HandleSpec:
+    """An agent handle with the forms the kickoff flow needs, derived once."""
+
+    at: str  # "@Name"
+    name: str  # "Name"
+    at_lower: str  # "@name", for case-insensitive mention checks
+
+    @classmethod
+    def of(cls, handle: "str | HandleSpec") -> "HandleSpec":
+        if isinstance(handle, HandleSpec):
+            return handle
+        stripped = handle.strip()
+        at = stripped if stripped.startswith("@") else f"@{stripped}"
+        return cls(at=at, name=at.lstrip("@"), at_lower=at.lower())
+
+    def __str__(self) -> str:
+        return self.at
+
+
 def load_templates() -> Dict[str, Any]:
-    if not CONFIG_PATH.exists():
-        raise FileNotFoundError(f"Conversation templates file not found at {CONFIG_PATH}")
-    with CONFIG_PATH.open("r", encoding="utf-8") as fh:
-        data = json.load(fh)
-    return data.get("templates", {})
+    try:
+        mtime_ns = CONFIG_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Conversation templates file not found at {CONFIG_PATH}") from None
+    # Keyed on mtime so repeat calls skip the read and parse until the file changes
+    return _load_json_cached(CONFIG_PATH, mtime_ns).get("templates", {})
+
+
+@lru_cache(maxsize=8)
+def _load_json_cached(path: Path, mtime_ns: int) -> Dict[str, Any]:
+    with path.open("r", encoding="utf-8") as fh:
+        return json.load(fh)
 
 
 def resolve_prompt_path(candidate: str | None, *, label: str, required: bool = False) -> Path | None:
@@ -72,27 +117,34 @@ def read_prompt_text(path: Path | None) -> str | None:
         return None
 
 
-def render_scenario_text(raw: str | None, initiator: str, responder: str) -> str | None:
+async def aread_prompt_text(path: Path | None) -> str | None:
+    """read_prompt_text on a worker thread so slow disks don't stall the loop."""
+    if not path:
+        return None
+    return await asyncio.to_thread(read_prompt_text, path)
+
+
+def render_scenario_text(
+    raw: str | None,
+    initiator: str | HandleSpec,
+    responder: str | HandleSpec,
+) -> str | None:
     if raw is None:
         return None
-    initiator_handle = initiator
-    responder_handle = responder
-    initiator_name = initiator_handle.lstrip("@")
-    responder_name = responder_handle.lstrip("@")
+    initiator = HandleSpec.of(initiator)
+    responder = HandleSpec.of(responder)
     replacements = {
-        "{initiator_handle}": initiator_handle,
-        "{initiator_name}": initiator_name,
-        "{responder_handle}": responder_handle,
-        "{responder_name}": responder_name,
-        "{player1_handle}": initiator_handle,
-        "{player1_name}": initiator_name,
-        "{player2_handle}": responder_handle,
-        "{player2_name}": responder_name,
+        ("initiator", "handle"): initiator.at,
+        ("initiator", "name"): initiator.name,
+        ("responder", "handle"): responder.at,
+        ("responder", "name"): responder.name,
+        ("player1", "handle"): initiator.at,
+        ("player1", "name"): initiator.name,
+        ("player2", "handle"): responder.at,
+        ("player2", "name"): responder.name,
     }
-    result = raw
-    for placeholder, value in replacements.items():
-        result = result.replace(placeholder, value)
-    return result
+    # One pass over the prompt instead of one full scan per placeholder
+    return _PLACEHOLDER_RE.sub(lambda match: replacements[match.groups()], raw)
 
 
 def compose_system_prompt_text(base_text: str | None, scenario_text: str | None) -> str | None:
@@ -105,64 +157,75 @@ def compose_system_prompt_text(base_text: str | None, scenario_text: str | None)
     return None
 
 
-def load_plugin(plugin_type: str, config: Dict[str, Any] | None = None):
+@lru_cache(maxsize=None)
+def _plugin_class(plugin_type: str) -> type:
     module = importlib.import_module(f"plugins.{plugin_type}_plugin")
     class_name = "".join(part.capitalize() for part in plugin_type.split("_")) + "Plugin"
-    plugin_cls = getattr(module, class_name)
-    return plugin_cls(config or {})
+    return getattr(module, class_name)
+
+
+def load_plugin(plugin_type: str, config: Dict[str, Any] | None = None):
+    return _plugin_class(plugin_type)(config or {})
+
+
+def _apply_env(updates: Dict[str, str | None]) -> Dict[str, str | None]:
+    """Apply ``updates`` to os.environ and return prior values of the keys that changed."""
+    previous: Dict[str, str | None] = {}
+    environ = os.environ
+    for key, value in updates.items():
+        current = environ.get(key)
+        if current == value:
+            # Already in the requested state: nothing to set or restore
+            continue
+        previous[key] = current
+        if value is None:
+            del environ[key]
+        else:
+            environ[key] = value
+    return previous
+
+
+def _restore_env(previous: Dict[str, str | None]) -> None:
+    for key, value in previous.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
 
 
 @contextmanager
 def temporary_env(**updates: str | None):
     """Temporarily set environment variables."""
-    previous: Dict[str, str | None] = {}
+    previous = _apply_env(updates)
     try:
-        for key, value in updates.items():
-            previous[key] = os.environ.get(key)
-            if value is None:
-                os.environ.pop(key, None)
-            else:
-                os.environ[key] = value
         yield
     finally:
-        for key, value in previous.items():
-            if value is None:
-                os.environ.pop(key, None)
-            else:
-                os.environ[key] = value
+        _restore_env(previous)
 
 
-def build_moderator_prompt(template: Dict[str, Any], initiator: str, responder: str) -> str:
+def build_moderator_prompt(
+    template: Dict[str, Any],
+    initiator: str | HandleSpec,
+    responder: str | HandleSpec,
+) -> str:
     name = template.get("name", template.get("description", "Unnamed Scenario"))
     description = template.get("description", "")
     starter = template.get("starter_message", "").strip()
 
-    pieces = [
-        f"Moderator kickoff for {initiator}:",
-        f"- You are about to chat with {responder} in the '{name}' scenario.",
-        "- Mention the responder in your first sentence and keep the reply under 200 words.",
-        "- Stay on-theme and sound natural—no reference to this moderator note.",
-    ]
-
+    extras = ""
     if description:
-        pieces.append(f"- Scenario context: {description}")
-
+        extras += f"\n- Scenario context: {description}"
     if starter:
-        pieces.append(
-            "- Inspiration from the original template (rephrase in your own words):\n"
-            + starter
-        )
-
-    pieces.append("Now craft the opening message you would post on aX.")
+        extras += f"\n- Inspiration from the original template (rephrase in your own words):\n{starter}"
 
-    return "\n".join(pieces)
+    return _MODERATOR_TEMPLATE.format(initiator=initiator, responder=responder, name=name, extras=extras)
 
 
 async def generate_initial_message(
     plugin_name: str,
     template_key: str,
-    initiator_handle: str,
-    responder_handle: str,
+    initiator_handle: str | HandleSpec,
+    responder_handle: str | HandleSpec,
     model: str | None,
     plugin_config: Dict[str, Any] | None,
     base_prompt_override: str | None,
@@ -192,11 +255,15 @@ async def generate_initial_message(
             required=True,
         )
 
-    base_text = read_prompt_text(base_path)
-    scenario_text = read_prompt_text(prompt_path)
+    base_text, scenario_text = await asyncio.gather(
+        aread_prompt_text(base_path),
+        aread_prompt_text(prompt_path),
+    )
     if scenario_text is None:
         scenario_text = template.get("system_context")
-    scenario_text = render_scenario_text(scenario_text, initiator_handle, responder_handle)
+    initiator = HandleSpec.of(initiator_handle)
+    responder = HandleSpec.of(responder_handle)
+    scenario_text = render_scenario_text(scenario_text, initiator, responder)
 
     combined_prompt = compose_system_prompt_text(base_text, scenario_text)
 
@@ -217,48 +284,50 @@ async def generate_initial_message(
     if model:
         env_updates["OLLAMA_MODEL"] = model
 
+    # Plugins read these overrides when constructed, so the scope covers only
+    # construction. Nothing in it awaits, so tasks running alongside (the aX
+    # connect in deliver_kickoff) never see the overridden environment.
     async with EnvScope(**env_updates):
         plugin = load_plugin(plugin_name, plugin_config)
-        moderator_prompt = build_moderator_prompt(template, initiator_handle, responder_handle)
-
-        stream_started = False
-
-        async def stream_handler(chunk: str) -> None:
-            nonlocal stream_started
-            if not chunk:
-                return
-            if not stream_started:
-                stream_started = True
-                print("\n🎙️ Streaming kickoff draft...\n")
-            print(chunk, end="", flush=True)
-
-        context = {
-            "sender": "@moderator",  # imaginary helper sending the setup
-            "agent_name": initiator_handle,
-            "required_mentions": [responder_handle],
-            "ignore_mentions": ["@moderator"],
-            "stream_handler": stream_handler,
-        }
-        response = await plugin.process_message(moderator_prompt, context=context)
-        if stream_started:
-            print("\n", end="", flush=True)
-        return response.strip()
-
-
-def ensure_mention_present(message: str, handle: str) -> str:
+
+    moderator_prompt = build_moderator_prompt(template, initiator, responder)
+
+    stream_started = False
+
+    async def stream_handler(chunk: str) -> None:
+        nonlocal stream_started
+        if not chunk:
+            return
+        if not stream_started:
+            stream_started = True
+            print("\n🎙️ Streaming kickoff draft...\n")
+        print(chunk, end="", flush=True)
+
+    context = {
+        "sender": "@moderator",  # imaginary helper sending the setup
+        "agent_name": initiator.at,
+        "required_mentions": [responder.at],
+        "ignore_mentions": ["@moderator"],
+        "stream_handler": stream_handler,
+    }
+    response = await plugin.process_message(moderator_prompt, context=context)
+    if stream_started:
+        print("\n", end="", flush=True)
+    return response.strip()
+
+
+def ensure_mention_present(message: str, handle: str | HandleSpec) -> str:
     stripped = message.strip()
-    normalized_handle = handle.strip()
-    if not normalized_handle.startswith("@"):
-        normalized_handle = f"@{normalized_handle}"
+    spec = HandleSpec.of(handle)
 
-    if normalized_handle.lower() in stripped.lower():
+    if spec.at_lower in stripped.lower():
         return stripped
 
     if stripped:
         separator = "" if stripped.endswith((" ", "\t", "\n")) else " "
-        return f"{stripped}{separator}{normalized_handle}"
+        return f"{stripped}{separator}{spec.at}"
 
-    return normalized_handle
+    return spec.at
 
 
 def collect_session_tags() -> list[str]:
@@ -286,8 +355,18 @@ def apply_session_tags(message: str, tags: list[str]) -> tuple[str, bool]:
     if not tags:
         return message, False
 
-    lower_text = message.lower()
-    missing: list[str] = [tag for tag in tags if tag.lower() not in lower_text]
+    # One pass collects the hashtags already in the message; each tag is then a set lookup
+    present = {token.lower() for token in _TAG_TOKEN.findall(message)}
+    lowered_message = message.lower()
+    missing: list[str] = []
+    for tag in tags:
+        lowered = tag.lower()
+        if lowered in present:
+            continue
+        if not _TAG_TOKEN.fullmatch(tag) and lowered in lowered_message:
+            # Tags with characters a hashtag token can't hold keep the substring check
+            continue
+        missing.append(tag)
     if not missing:
         return message, False
 
@@ -301,41 +380,67 @@ async def send_to_ax(
     config_path: str | None,
     server_name: str | None,
 ) -> tuple[bool, str]:
+    client, agent_name = _ax_client(config_path, server_name)
+    success = await client.send_message(message)
+    return success, HandleSpec.of(agent_name).at
+
+
+def _ax_client(config_path: str | None, server_name: str | None) -> tuple[MCPClient, str]:
+    """Return the pooled client for the resolved MCP config, creating it if needed."""
     resolved_path = config_path or get_default_config_path()
     if not resolved_path:
         raise ValueError("No MCP config path provided and none discovered via get_default_config_path().")
 
     cfg = parse_mcp_config(resolved_path, server_name)
-    client = MCPClient(
-        server_url=cfg.server_url,
-        oauth_server=cfg.oauth_url,
-        agent_name=cfg.agent_name,
-        token_dir=cfg.token_dir,
-    )
+    key = (cfg.server_url, cfg.agent_name)
+    client = _AX_CLIENTS.get(key)
+    if client is None:
+        client = MCPClient(
+            server_url=cfg.server_url,
+            oauth_server=cfg.oauth_url,
+            agent_name=cfg.agent_name,
+            token_dir=cfg.token_dir,
+        )
+        _AX_CLIENTS[key] = client
+    return client, cfg.agent_name
+
+
+async def prewarm_ax(config_path: str | None, server_name: str | None) -> bool:
+    """Connect the pooled client ahead of time; failures are left for the send to report.
+
+    Must run in the task that later sends and disconnects: the MCP SDK's
+    transport contexts can only be exited by the task that entered them.
+    """
     try:
-        success = await client.send_message(message)
-    finally:
+        client, _ = _ax_client(config_path, server_name)
+        return await client.warm_up()
+    except Exception:
+        return False
+
+
+async def close_ax_clients() -> None:
+    """Disconnect every client opened by send_to_ax."""
+    while _AX_CLIENTS:
+        _, client = _AX_CLIENTS.popitem()
         try:
-            await client.disconnect()
+            await client.close()
         except Exception:
             pass
-    agent_handle = cfg.agent_name if cfg.agent_name.startswith("@") else f"@{cfg.agent_name}"
-    return success, agent_handle
 
 
 class EnvScope:
-    """Async-friendly wrapper around temporary_env for convenience."""
+    """Async counterpart of temporary_env, without the generator round trip."""
 
     def __init__(self, **updates: str | None):
         self._updates = updates
-        self._cm = temporary_env(**updates)
+        self._previous: Dict[str, str | None] = {}
 
     async def __aenter__(self):
-        self._cm.__enter__()
+        self._previous = _apply_env(self._updates)
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
-        self._cm.__exit__(exc_type, exc, tb)
+        _restore_env(self._previous)
         return False
 
 
@@ -396,50 +501,27 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def normalize_handle(handle: str) -> str:
-    handle = handle.strip()
-    if not handle:
+def normalize_handle(handle: str) -> HandleSpec:
+    if not handle.strip():
         raise ValueError("Handle cannot be blank")
-    return handle if handle.startswith("@") else f"@{handle}"
+    return HandleSpec.of(handle)
 
 
 def load_plugin_config(path: str | None) -> Dict[str, Any] | None:
     if not path:
         return None
     config_path = Path(path).expanduser().resolve()
-    with config_path.open("r", encoding="utf-8") as fh:
-        return json.load(fh)
+    # Plugins may adjust their config, so hand out a copy of the cached parse
+    return dict(_load_json_cached(config_path, config_path.stat().st_mtime_ns))
 
 
-async def main() -> int:
-    args = parse_args()
-    initiator = normalize_handle(args.initiator)
-    responder = normalize_handle(args.responder)
-    plugin_config = load_plugin_config(args.plugin_config)
-
-    templates = load_templates()
-    if args.template not in templates:
-        print(f"❌ Template '{args.template}' not found. Available: {', '.join(sorted(templates.keys()))}")
-        return 1
-    template = templates[args.template]
-
-    print("🔧 Running moderator prompt prototype...")
-    print(f"   Plugin: {args.plugin}")
-    print(f"   Template: {args.template}")
-    if args.model:
-        print(f"   Model override: {args.model}")
-    if args.base_prompt:
-        print(f"   Base prompt override: {args.base_prompt}")
-    elif os.getenv("OLLAMA_BASE_PROMPT_FILE"):
-        print(f"   Base prompt (env): {os.getenv('OLLAMA_BASE_PROMPT_FILE')}")
-    if args.scenario_prompt:
-        print(f"   Scenario prompt override: {args.scenario_prompt}")
-    if plugin_config:
-        print(f"   Plugin config: {args.plugin_config}")
-    if args.send:
-        config_hint = args.config_path or get_default_config_path()
-        print(f"   Send to aX: enabled (config={config_hint or 'auto-discover'})")
-
+async def deliver_kickoff(
+    args: argparse.Namespace,
+    template: Dict[str, Any],
+    initiator: HandleSpec,
+    responder: HandleSpec,
+    plugin_config: Dict[str, Any] | None,
+) -> int:
     moderator_prompt = None
     if args.message:
         candidate_message = args.message.strip()
@@ -448,8 +530,8 @@ async def main() -> int:
             return 1
         print("\n🗒️  Skipping generation – using provided kickoff message.\n")
     else:
-        try:
-            candidate_message = await generate_initial_message(
+        generation = asyncio.create_task(
+            generate_initial_message(
                 plugin_name=args.plugin,
                 template_key=args.template,
                 initiator_handle=initiator,
@@ -459,9 +541,23 @@ async def main() -> int:
                 base_prompt_override=args.base_prompt,
                 scenario_prompt_override=args.scenario_prompt,
             )
+        )
+        try:
+            if args.send:
+                # Connect to aX while the plugin generates. The connection is
+                # opened here so the same task later sends and disconnects it.
+                await prewarm_ax(args.config_path, args.config_server)
+            candidate_message = await generation
         except Exception as exc:
             print(f"❌ Failed to generate kickoff message: {exc}")
             return 1
+        finally:
+            if not generation.done():
+                # Wait for the cancellation to land so the plugin call is
+                # torn down before the caller moves on
+                generation.cancel()
+                with suppress(asyncio.CancelledError):
+                    await generation
 
         moderator_prompt = build_moderator_prompt(template, initiator, responder)
         print("\n🗒️  Sample moderator instruction that was sent to the plugin:\n")
@@ -503,7 +599,7 @@ async def main() -> int:
         return 1
 
     print(f"✅ Message sent via agent credentials for {config_agent}.")
-    if config_agent.lower() != initiator.lower():
+    if config_agent.lower() != initiator.at_lower:
         print(
             "⚠️  Note: MCP config agent differs from the initiator handle provided. "
             "Make sure this is intentional."
@@ -511,6 +607,50 @@ async def main() -> int:
     return 0
 
 
+async def main() -> int:
+    args = parse_args()
+    initiator = normalize_handle(args.initiator)
+    responder = normalize_handle(args.responder)
+    plugin_config = load_plugin_config(args.plugin_config)
+
+    templates = load_templates()
+    if args.template not in templates:
+        print(f"❌ Template '{args.template}' not found. Available: {', '.join(sorted(templates.keys()))}")
+        return 1
+    template = templates[args.template]
+
+    if not args.message:
+        # Import the plugin up front so generation starts warm; the instance
+        # itself is built later, once the prompt environment is in place
+        try:
+            _plugin_class(args.plugin)
+        except (ImportError, AttributeError) as exc:
+            print(f"❌ Failed to load plugin '{args.plugin}': {exc}")
+            return 1
+
+    print("🔧 Running moderator prompt prototype...")
+    print(f"   Plugin: {args.plugin}")
+    print(f"   Template: {args.template}")
+    if args.model:
+        print(f"   Model override: {args.model}")
+    if args.base_prompt:
+        print(f"   Base prompt override: {args.base_prompt}")
+    elif os.getenv("OLLAMA_BASE_PROMPT_FILE"):
+        print(f"   Base prompt (env): {os.getenv('OLLAMA_BASE_PROMPT_FILE')}")
+    if args.scenario_prompt:
+        print(f"   Scenario prompt override: {args.scenario_prompt}")
+    if plugin_config:
+        print(f"   Plugin config: {args.plugin_config}")
+    if args.send:
+        config_hint = args.config_path or get_default_config_path()
+        print(f"   Send to aX: enabled (config={config_hint or 'auto-discover'})")
+
+    try:
+        return await deliver_kickoff(args, template, initiator, responder, plugin_config)
+    finally:
+        await close_ax_clients()
+
+
 if __name__ == "__main__":
     try:
         raise SystemExit(asyncio.run(main()))
@@ -4,10 +4,20 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import itertools
+import logging
 import os
 import sys
-from datetime import datetime
+import time
+import uuid
 from pathlib import Path
+from typing import Iterator
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional speedup
+    uvloop = None  # type: ignore[assignment]
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "src"))
@@ -15,43 +25,148 @@ sys.path.insert(0, str(ROOT / "src"))
 from ax_mcp_wait_client.config_loader import get_default_config_path, parse_mcp_config
 from ax_mcp_wait_client.mcp_client import MCPClient
 
+logger = logging.getLogger("spam_mentions")
+
+DEFAULT_TARGET = "@cbms"
+PAYLOAD_MARKER = " queue test #"
+
+
+@functools.lru_cache(maxsize=8)
+def payload_prefixes(targets: tuple[str, ...]) -> tuple[str, ...]:
+    """Return the static ``"<handle> queue test #"`` prefix for each target."""
+    return tuple(f"{target}{PAYLOAD_MARKER}" for target in targets)
+
+
+def iter_mentions(targets: tuple[str, ...], count: int) -> Iterator[tuple[int, str]]:
+    """Lazily yield ``(idx, prefix)`` pairs, rotating round-robin through ``targets``."""
+    return zip(range(1, count + 1), itertools.cycle(payload_prefixes(targets)))
+
+
+def interval_for(idx: int, delay: float, start_delay: float, ramp: int) -> float:
+    """Gap after message ``idx``; ramps linearly from ``start_delay`` to ``delay``."""
+    if idx > ramp:
+        return delay
+    return start_delay + (delay - start_delay) * (idx - 1) / ramp
+
 
 async def main() -> int:
     config_path = os.getenv("MCP_CONFIG_PATH") or get_default_config_path()
     if not config_path:
-        print("❌ No MCP config path found. Set MCP_CONFIG_PATH to a valid config JSON file.")
+        logger.error("❌ No MCP config path found. Set MCP_CONFIG_PATH to a valid config JSON file.")
         return 1
 
-    target = os.getenv("SPAM_TARGET", "@cbms")
+    targets = tuple(t.strip() for t in os.getenv("SPAM_TARGET", DEFAULT_TARGET).split(",") if t.strip())
+    if not targets:
+        logger.error("❌ SPAM_TARGET must name at least one handle.")
+        return 1
     count = int(os.getenv("SPAM_COUNT", "5"))
     delay = float(os.getenv("SPAM_DELAY", "0.2"))
+    start_delay = float(os.getenv("SPAM_START_DELAY", str(delay)))
+    ramp = max(0, int(os.getenv("SPAM_RAMP", "0")))
+    batch = max(1, int(os.getenv("SPAM_BATCH", "1")))
+    max_inflight = max(1, int(os.getenv("SPAM_MAX_INFLIGHT", "1")))
+    log_path = os.getenv("SPAM_LOG")
 
     cfg = parse_mcp_config(config_path)
-    client = MCPClient(
-        server_url=cfg.server_url,
-        oauth_server=cfg.oauth_url,
-        agent_name=cfg.agent_name,
-        token_dir=cfg.token_dir,
-    )
-
-    await client.connect()
+
+    # Opened once for the whole run (line-buffered) instead of per message.
+    log_fh = Path(log_path).expanduser().open("a", encoding="utf-8", buffering=1) if log_path else None
+    # Disk writes happen off the send path; the bounded queue applies
+    # backpressure if the log falls far behind.
+    log_q: asyncio.Queue[str | None] = asyncio.Queue(maxsize=1000)
+    # Chunks wait here for the next free sender; None tells a sender to stop.
+    work_q: asyncio.Queue[tuple[str, list[tuple[str, str]]] | None] = asyncio.Queue(maxsize=max_inflight * 2)
+
+    async def write_log() -> None:
+        while (line := await log_q.get()) is not None:
+            await asyncio.to_thread(log_fh.write, line)
+
+    async def sender(ready: asyncio.Future[bool]) -> None:
+        # Each sender owns its client: it connects, sends and closes within
+        # this task, so MCPClient's reconnect-on-failure never crosses tasks.
+        client = MCPClient(
+            server_url=cfg.server_url,
+            oauth_server=cfg.oauth_url,
+            agent_name=cfg.agent_name,
+            token_dir=cfg.token_dir,
+        )
+        try:
+            # Pay connection/auth warm-up before the first timed send.
+            ready.set_result(await client.warm_up())
+            if not ready.result():
+                return
+            while (work := await work_q.get()) is not None:
+                stamp, items = work
+                for key, payload in items:
+                    if await client.send_message(payload, key):
+                        logger.info("✅ Sent: %s", payload)
+                        if log_fh:
+                            await log_q.put(f"- {stamp} :: {payload}\n")
+                    else:
+                        logger.error("❌ Failed to send: %s", payload)
+        finally:
+            if not ready.done():
+                ready.set_result(False)
+            await client.close()
+
+    loop = asyncio.get_running_loop()
+    ready = [loop.create_future() for _ in range(max_inflight)]
+    senders = [asyncio.create_task(sender(r)) for r in ready]
+    writer = asyncio.create_task(write_log()) if log_fh else None
     try:
-        for idx in range(1, count + 1):
-            payload = f"{target} queue test #{idx} ({datetime.utcnow():%H:%M:%S})"
-            if await client.send_message(payload):
-                print(f"✅ Sent: {payload}")
+        if not all(await asyncio.gather(*ready)):
+            logger.error("❌ Could not connect to %s; aborting before the timed run", cfg.server_url)
+            return 1
+        mentions = iter_mentions(targets, count)
+        # Chunks are handed to up to SPAM_MAX_INFLIGHT senders, each with its
+        # own session, so the cadence timer never waits on a send.
+        t0 = loop.time()
+        offset = 0.0
+        # Keys are derived from the run and index so retries never duplicate.
+        key_prefix = f"spam-{uuid.uuid4().hex[:8]}-"
+        while chunk := list(itertools.islice(mentions, batch)):
+            stamp = time.strftime("%H:%M:%S", time.gmtime())
+            items = [(key_prefix + str(idx), f"{prefix}{idx} ({stamp})") for idx, prefix in chunk]
+            await work_q.put((stamp, items))
+            offset += sum(interval_for(idx, delay, start_delay, ramp) for idx, _ in chunk)
+            if offset > 0:
+                # Sleep to an absolute deadline so slow sends don't stretch the cadence.
+                await asyncio.sleep(max(0.0, t0 + offset - loop.time()))
             else:
-                print(f"❌ Failed to send: {payload}")
-            await asyncio.sleep(delay)
+                # No pacing requested, but still yield so the senders and
+                # log-writer task get to run between chunks.
+                await asyncio.sleep(0)
+        for _ in senders:
+            await work_q.put(None)
+        await asyncio.gather(*senders)
     finally:
-        await client.disconnect()
+        # Cancel whatever is still in flight (error or Ctrl-C); each sender
+        # closes its own client, mirroring TaskGroup semantics on Python 3.10.
+        for task in senders:
+            task.cancel()
+        await asyncio.gather(*senders, return_exceptions=True)
+        if writer:
+            # If the writer died (e.g. disk full) with the queue full, a bare
+            # put would wait forever for a reader; stop waiting once it exits.
+            stop = asyncio.ensure_future(log_q.put(None))
+            await asyncio.wait({stop, writer}, return_when=asyncio.FIRST_COMPLETED)
+            stop.cancel()
+            try:
+                await writer
+            finally:
+                log_fh.close()
 
     return 0
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    # MCPClient logs every send at INFO; keep only our own progress lines.
+    logging.getLogger("ax_mcp_wait_client").setLevel(logging.WARNING)
+    # uvloop.run replaces the deprecated uvloop.install() policy switch.
+    run = uvloop.run if uvloop is not None else asyncio.run
     try:
-        exit(asyncio.run(main()))
+        exit(run(main()))
     except KeyboardInterrupt:
         print("\n👋 Spam script interrupted")
         exit(130)
@@ -9,9 +9,22 @@ from typing import Optional, Tuple, Dict, Any
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
+def load_json_file(path: Path) -> Any:
+    """Parse a JSON file, using orjson on the raw bytes when it is installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 class BearerTokenStore:
     """Load/save and refresh bearer tokens from mcp-remote token files.
 
@@ -31,14 +44,9 @@ class BearerTokenStore:
 
     def _find_latest(self) -> Optional[Path]:
         # Only look in mcp-remote versioned folders
-        candidates = []
-        for sub in self.base_dir.glob("mcp-remote-*"):
-            candidates.extend(sub.glob("*_tokens.json"))
-        if candidates:
-            candidates.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-            return candidates[0]
-        # No fallback to root tokens.json
-        return None
+        candidates = (f for sub in self.base_dir.glob("mcp-remote-*") for f in sub.glob("*_tokens.json"))
+        # Newest by mtime in one pass; no fallback to root tokens.json
+        return max(candidates, key=lambda p: p.stat().st_mtime, default=None)
 
     def token_file(self) -> Optional[Path]:
         if self.explicit_file:
@@ -65,8 +73,7 @@ class BearerTokenStore:
             logger.debug(f"No token file found in {self.base_dir}")
             return None
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_json_file(path)
             self._selected = path
             self._token_cache = data
             self._last_load_time = now
@@ -113,9 +120,9 @@ class BearerTokenStore:
                 return f
         # Or search in mcp-remote folders
         for sub in self.base_dir.glob("mcp-remote-*"):
-            files = list(sub.glob("*_client_info.json"))
-            if files:
-                return files[0]
+            first = next(sub.glob("*_client_info.json"), None)
+            if first is not None:
+                return first
         # No fallback to root directory
         return None
 
@@ -124,8 +131,7 @@ class BearerTokenStore:
         if not p:
             return None
         try:
-            with open(p, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_json_file(p)
             return data.get("client_id") or data.get("client_name")
         except Exception:
             return None
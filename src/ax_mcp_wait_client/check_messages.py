@@ -111,17 +111,19 @@ async def main() -> int:
             async with ClientSession(read, write) as session:
                 await session.initialize()
 
-                # Preflight
-                await session.call_tool('messages', {
-                    'action': 'check',
-                    'wait': False,
-                    'mode': 'latest',
-                    'limit': 0,
-                })
-                import asyncio as _aio
-                await _aio.sleep(0.2)
-
                 wait_mode = os.getenv('MCP_WAIT', 'false').lower() == 'true'
+                if wait_mode:
+                    # Preflight before blocking; a non-wait check is already
+                    # a single round trip, so it needs no separate probe
+                    await session.call_tool('messages', {
+                        'action': 'check',
+                        'wait': False,
+                        'mode': 'latest',
+                        'limit': 0,
+                    })
+                    import asyncio as _aio
+                    await _aio.sleep(0.2)
+
                 return await session.call_tool('messages', {
                     'action': 'check',
                     'wait': wait_mode,
@@ -6,11 +6,18 @@ Parses MCP config files (like those used by Claude) and extracts server settings
 Supports multiple server definitions and environment variables.
 """
 
+import copy
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 
 class MCPConfig:
     """Represents configuration for an MCP server connection"""
@@ -38,11 +45,25 @@ def parse_mcp_config(config_path: str, server_name: Optional[str] = None) -> MCP
     """
     config_path = Path(config_path).expanduser()
     
-    if not config_path.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
-    
-    with open(config_path, 'r') as f:
-        config = json.load(f)
+    # One stat both checks existence and supplies the cache key
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
+    
+    # Keyed on mtime so edits to the file are picked up on the next call.
+    # Each caller gets its own copy, so mutating it cannot leak into the
+    # cached entry other callers share.
+    return copy.copy(_parse_mcp_config_cached(config_path, server_name, mtime_ns))
+
+
+@lru_cache(maxsize=16)
+def _parse_mcp_config_cached(config_path: Path, server_name: Optional[str], mtime_ns: int) -> MCPConfig:
+    if orjson is not None:
+        config = orjson.loads(config_path.read_bytes())
+    else:
+        with open(config_path, 'r') as f:
+            config = json.load(f)
     
     servers = config.get('mcpServers', {})
     
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib
+import json
 from dataclasses import dataclass
 from typing import Protocol, Optional
 
@@ -72,26 +73,38 @@ class EchoHandler:
     def _extract_message_id_from_search(self, search_result) -> Optional[str]:
         # Prefer structured content
         data = getattr(search_result, "structuredContent", None)
-        if not data:
-            # Try to parse textual content list
+        if isinstance(data, dict):
+            return self._first_message_id(data)
+
+        # Text blocks may carry the same payload as JSON: decode them one at a
+        # time and stop at the first id rather than joining every block up front.
+        for block in getattr(search_result, "content", None) or ():
+            if getattr(block, "type", "") != "text":
+                continue
+            text = getattr(block, "text", None)
+            if not text or not text.lstrip().startswith("{"):
+                continue
             try:
-                blocks = getattr(search_result, "content", []) or []
-                texts = [getattr(b, "text", None) for b in blocks if getattr(b, "type", "") == "text"]
-                data = {"_text": "\n".join([t for t in texts if t])}
-            except Exception:
-                data = None
+                payload = json.loads(text)
+            except ValueError:
+                continue
+            if isinstance(payload, dict):
+                mid = self._first_message_id(payload)
+                if mid:
+                    return mid
+        return None
 
-        # Heuristic extraction
-        if isinstance(data, dict):
-            # Common shapes: {'results': [{'id': '...'} ...]}
-            for key in ("results", "items", "messages", "data"):
-                arr = data.get(key)
-                if isinstance(arr, list):
-                    for it in arr:
-                        if isinstance(it, dict):
-                            mid = it.get("id") or it.get("message_id") or it.get("short_id")
-                            if mid:
-                                return mid
+    @staticmethod
+    def _first_message_id(data: dict) -> Optional[str]:
+        # Common shapes: {'results': [{'id': '...'} ...]}
+        for key in ("results", "items", "messages", "data"):
+            arr = data.get(key)
+            if isinstance(arr, list):
+                for it in arr:
+                    if isinstance(it, dict):
+                        mid = it.get("id") or it.get("message_id") or it.get("short_id")
+                        if mid:
+                            return mid
         return None
 
 
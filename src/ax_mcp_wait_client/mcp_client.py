@@ -6,6 +6,7 @@ Persistent MCP client with bearer refresh, expiry checks, and 401 backoff.
 import os
 import json
 import time
+import random
 import asyncio
 import logging
 from pathlib import Path
@@ -15,10 +16,20 @@ from datetime import datetime, timedelta, timezone
 import httpx
 from mcp.client.session import ClientSession
 from mcp.client.streamable_http import streamablehttp_client
-from ax_mcp_wait_client.bearer_refresh import BearerTokenStore, MCPBearerAuth
+from ax_mcp_wait_client.bearer_refresh import BearerTokenStore, MCPBearerAuth, load_json_file
 
 logger = logging.getLogger(__name__)
 
+MAX_BACKOFF_SECONDS = 10.0
+
+
+def _first_text(result: Any) -> Optional[str]:
+    """Return the first text block of a CallToolResult, if any."""
+    for item in result.content or ():
+        if item.type == "text":
+            return item.text
+    return None
+
 
 class TokenManager:
     """Manages tokens on disk with proactive refresh and expiry checks."""
@@ -37,18 +48,16 @@ class TokenManager:
         self.last_refresh = 0.0
         self._token_cache: Optional[Dict[str, Any]] = None
         self._selected_path: Optional[Path] = None
+        # Created on first refresh and kept for the process, so refreshes
+        # triggered by reconnects reuse the pooled OAuth connection
+        self._http: Optional[httpx.Client] = None
 
     def _token_file(self) -> Optional[Path]:
         # Prefer mcp-remote versioned files like other MCP clients
-        candidates: list[Path] = []
-        for subdir in self.token_dir.glob("mcp-remote-*"):
-            candidates.extend(subdir.glob("*_tokens.json"))
-        if candidates:
-            # Choose most recent by mtime
-            candidates.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-            return candidates[0]
+        candidates = (f for subdir in self.token_dir.glob("mcp-remote-*") for f in subdir.glob("*_tokens.json"))
+        # Choose most recent by mtime in one pass.
         # No fallback to root tokens.json - only use mcp-remote directory
-        return None
+        return max(candidates, key=lambda p: p.stat().st_mtime, default=None)
 
     def load_tokens(self) -> Optional[Dict[str, Any]]:
         path = self._token_file()
@@ -56,8 +65,7 @@ class TokenManager:
             logger.error(f"No token file found in {self.token_dir}")
             return None
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_json_file(path)
             self._token_cache = data
             self._selected_path = path
             return data
@@ -140,7 +148,9 @@ class TokenManager:
             "client_id": "MCP CLI Proxy",
         }
         try:
-            resp = httpx.post(url, data=data, timeout=10)
+            if self._http is None:
+                self._http = httpx.Client(timeout=10)
+            resp = self._http.post(url, data=data)
             if resp.status_code == 200:
                 new_tokens = resp.json()
                 tokens.update(new_tokens)
@@ -158,6 +168,12 @@ class TokenManager:
     def get_access_token(self) -> Optional[str]:
         return self.refresh_token(force=False)
 
+    def close(self) -> None:
+        """Release the pooled OAuth connection; a later refresh opens a new one."""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
 
 class MCPClient:
     """Persistent MCP client with single connection and backoff on 401."""
@@ -174,7 +190,9 @@ class MCPClient:
         self.agent_name = agent_name
         self._lock = asyncio.Lock()
         self._connected = False
-        self._start_ts = time.time()
+        # Set once a preflight check has succeeded on the current session
+        self._preflighted = False
+        self._start_ts = time.monotonic()
 
         if not token_dir:
             token_dir = os.getenv("MCP_REMOTE_CONFIG_DIR")
@@ -197,6 +215,8 @@ class MCPClient:
         self.session: Optional[ClientSession] = None
         self.client_instance = None
         self.session_id = None
+        # Bearer auth (and its token cache) survives reconnects
+        self._bearer_auth: Optional[MCPBearerAuth] = None
 
     async def connect(self) -> bool:
         async with self._lock:
@@ -216,11 +236,12 @@ class MCPClient:
                 # Choose auth strategy: bearer via MCPBearerAuth when MCP_BEARER_MODE=1, else header with manual refresh
                 auth_obj = None
                 if os.getenv("MCP_BEARER_MODE", "0") == "1":
-                    store = BearerTokenStore(self.token_dir)
-                    if not store.token_file():
+                    if self._bearer_auth is None:
+                        self._bearer_auth = MCPBearerAuth(BearerTokenStore(self.token_dir), self.oauth_server)
+                    if not self._bearer_auth.store.token_file():
                         logger.error("No bearer token file found. Set MCP_TOKEN_FILE or ensure mcp-remote tokens exist.")
                         return False
-                    auth_obj = MCPBearerAuth(store, self.oauth_server)
+                    auth_obj = self._bearer_auth
                 else:
                     access_token = self.token_manager.get_access_token()
                     if not access_token:
@@ -246,7 +267,7 @@ class MCPClient:
                 # Suppress transient transport parse errors during early startup
                 _stream_logger = logging.getLogger('mcp.client.streamable_http')
                 _prev_level = _stream_logger.level
-                if (time.time() - getattr(self, '_start_ts', time.time())) < 10:
+                if (time.monotonic() - getattr(self, '_start_ts', time.monotonic())) < 10:
                     _stream_logger.setLevel(logging.CRITICAL)
                 try:
                     await self.session.initialize()
@@ -278,6 +299,22 @@ class MCPClient:
                 self._stream_ctx = None
             self.read = self.write = self.get_sid = None
             self._connected = False
+            self._preflighted = False
+
+    async def close(self) -> None:
+        """Disconnect and release the token refresher's HTTP pool.
+
+        Use at shutdown; disconnect() alone keeps the pool for reconnects.
+        """
+        await self.disconnect()
+        self.token_manager.close()
+
+    @staticmethod
+    async def _backoff(delay: float) -> float:
+        """Sleep for a jittered ``delay`` and return the next, capped, delay."""
+        # Jitter keeps concurrent senders from retrying in lockstep.
+        await asyncio.sleep(delay * (0.5 + random.random() * 0.5))
+        return min(delay * 2, MAX_BACKOFF_SECONDS)
 
     async def _preflight(self) -> None:
         if not self.session:
@@ -285,13 +322,14 @@ class MCPClient:
         try:
             _stream_logger = logging.getLogger('mcp.client.streamable_http')
             _prev_level = _stream_logger.level
-            if (time.time() - self._start_ts) < 10:
+            if (time.monotonic() - self._start_ts) < 10:
                 _stream_logger.setLevel(logging.CRITICAL)
             await self.session.call_tool(
                 "messages",
                 {"action": "check", "wait": False, "mode": "latest", "limit": 0},
             )
             await asyncio.sleep(0.2)
+            self._preflighted = True
         except Exception:
             # ignore preflight errors; main call will handle
             pass
@@ -301,34 +339,48 @@ class MCPClient:
             except Exception:
                 pass
 
-    async def check_messages(self, wait: bool = False, timeout: int = 60, limit: int = 5) -> Optional[str]:
+    async def warm_up(self) -> bool:
+        """Connect and issue a no-op check so the first real call skips cold start."""
+        if not await self.connect():
+            return False
+        await self._preflight()
+        return True
+
+    async def check_messages(
+        self,
+        wait: bool = False,
+        timeout: int = 60,
+        limit: int = 5,
+        stall_timeout: Optional[float] = None,
+    ) -> Optional[str]:
+        """Run a messages check, retrying with backoff.
+
+        ``stall_timeout`` bounds each call on the session itself; a call that
+        outlives it is treated like any other failure (disconnect, back off,
+        retry), so the connection stays owned by the calling task.
+        """
+        read_timeout = timedelta(seconds=stall_timeout) if stall_timeout else None
+        # Arguments are identical across retries; build them once.
+        arguments = {
+            "action": "check",
+            "wait": wait,
+            "wait_mode": "mentions" if wait else None,
+            "timeout": timeout if wait else None,
+            "mode": "latest",
+            "limit": limit,
+        }
         backoff = 1.0
         for attempt in range(5):
             if not await self.connect():
-                await asyncio.sleep(backoff)
-                backoff = min(backoff * 2, 10)
+                backoff = await self._backoff(backoff)
                 continue
             try:
                 _stream_logger = logging.getLogger('mcp.client.streamable_http')
                 _prev_level = _stream_logger.level
-                if (time.time() - self._start_ts) < 10 and attempt == 0:
+                if (time.monotonic() - self._start_ts) < 10 and attempt == 0:
                     _stream_logger.setLevel(logging.CRITICAL)
-                res = await self.session.call_tool(
-                    "messages",
-                    {
-                        "action": "check",
-                        "wait": wait,
-                        "wait_mode": "mentions" if wait else None,
-                        "timeout": timeout if wait else None,
-                        "mode": "latest",
-                        "limit": limit,
-                    },
-                )
-                text = None
-                for c in getattr(res, "content", []) or []:
-                    if getattr(c, "type", "") == "text" and hasattr(c, "text"):
-                        text = c.text
-                        break
+                res = await self.session.call_tool("messages", arguments, read_timeout_seconds=read_timeout)
+                text = _first_text(res)
                 return text or str(getattr(res, "__dict__", res))
             except Exception as e:
                 msg = str(e)
@@ -336,16 +388,14 @@ class MCPClient:
                     logger.warning("401 on check; refreshing token with backoff")
                     self.token_manager.refresh_token(force=True)
                     await self.disconnect()
-                    await asyncio.sleep(backoff)
-                    backoff = min(backoff * 2, 10)
+                    backoff = await self._backoff(backoff)
                     continue
                 if "ValidationError" in msg or "Error parsing JSON response" in msg:
                     logger.debug(f"Check messages early-startup noise: {e}")
                 else:
                     logger.error(f"Check messages failed: {e}")
                 await self.disconnect()
-                await asyncio.sleep(backoff)
-                backoff = min(backoff * 2, 10)
+                backoff = await self._backoff(backoff)
             finally:
                 try:
                     _stream_logger.setLevel(_prev_level)
@@ -353,46 +403,59 @@ class MCPClient:
                     pass
         return None
 
-    async def send_message(self, message: str) -> bool:
+    async def send_message(
+        self,
+        message: str,
+        idempotency_key: Optional[str] = None,
+        reconnect: bool = True,
+    ) -> bool:
+        """Send a message, retrying with backoff.
+
+        With ``reconnect=False`` the message goes out once on the current
+        session and a failure leaves the connection alone. Callers sending
+        from a task other than the one that connected use it so the owning
+        task stays the only one that disconnects and reconnects.
+        """
         import uuid
-        idem_key = str(uuid.uuid4())
+        # The same key is reused on every retry so the server can dedupe.
+        idem_key = idempotency_key or str(uuid.uuid4())
+        arguments = {"action": "send", "content": message, "idempotency_key": idem_key}
         backoff = 1.0
-        for attempt in range(5):
-            if not await self.connect():
-                await asyncio.sleep(backoff)
-                backoff = min(backoff * 2, 10)
+        for attempt in range(5 if reconnect else 1):
+            if not reconnect:
+                if not (self._connected and self.session):
+                    return False
+            elif not await self.connect():
+                backoff = await self._backoff(backoff)
                 continue
             try:
-                await self._preflight()
+                # One preflight per session is enough; later sends on the same
+                # session skip the extra check round trip and 200 ms pause
+                if not self._preflighted:
+                    await self._preflight()
                 _stream_logger = logging.getLogger('mcp.client.streamable_http')
                 _prev_level = _stream_logger.level
-                if (time.time() - self._start_ts) < 10 and attempt == 0:
+                if (time.monotonic() - self._start_ts) < 10 and attempt == 0:
                     _stream_logger.setLevel(logging.CRITICAL)
-                res = await self.session.call_tool(
-                    "messages",
-                    {"action": "send", "content": message, "idempotency_key": idem_key},
-                )
+                res = await self.session.call_tool("messages", arguments)
                 # Consider any response a success; server-side idempotency should dedupe
-                text = None
-                for c in getattr(res, "content", []) or []:
-                    if getattr(c, "type", "") == "text" and hasattr(c, "text"):
-                        text = c.text
-                        break
+                text = _first_text(res)
                 logger.info(f"message sent (idem={idem_key}) -> {text or 'ok'}")
                 return True
             except Exception as e:
+                if not reconnect:
+                    logger.error(f"Send message failed: {e}")
+                    return False
                 msg = str(e)
                 if "401" in msg:
                     logger.warning("401 on send; refreshing token with backoff")
                     self.token_manager.refresh_token(force=True)
                     await self.disconnect()
-                    await asyncio.sleep(backoff)
-                    backoff = min(backoff * 2, 10)
+                    backoff = await self._backoff(backoff)
                     continue
                 logger.error(f"Send message failed: {e}")
                 await self.disconnect()
-                await asyncio.sleep(backoff)
-                backoff = min(backoff * 2, 10)
+                backoff = await self._backoff(backoff)
             finally:
                 try:
                     _stream_logger.setLevel(_prev_level)
@@ -404,8 +467,11 @@ class MCPClient:
 async def simple_example() -> None:
     logging.basicConfig(level=logging.INFO)
     client = MCPClient(token_refresh_seconds=600)
-    ok = await client.send_message("[MCPClient] Test message from persistent client")
-    print(f"Result: {ok}")
+    try:
+        ok = await client.send_message("[MCPClient] Test message from persistent client")
+        print(f"Result: {ok}")
+    finally:
+        await client.close()
 
 
 if __name__ == "__main__":
@@ -37,16 +37,10 @@ class MCPRemoteWrapper:
     def _find_token_file(self) -> Optional[Path]:
         """Find the most recent token file in mcp-remote directory structure."""
         # Look for mcp-remote versioned directories
-        candidates = []
-        for subdir in self.token_dir.glob("mcp-remote-*"):
-            candidates.extend(subdir.glob("*_tokens.json"))
+        candidates = (f for subdir in self.token_dir.glob("mcp-remote-*") for f in subdir.glob("*_tokens.json"))
         
-        if candidates:
-            # Return most recent by modification time
-            candidates.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-            return candidates[0]
-        
-        return None
+        # Return most recent by modification time
+        return max(candidates, key=lambda p: p.stat().st_mtime, default=None)
     
     def _compute_server_hash(self) -> str:
         """Compute the hash that mcp-remote uses for token files."""
@@ -115,8 +115,7 @@ class MCPServerTester:
             if agent_dir.is_dir():
                 # Look for mcp-remote tokens
                 for mcp_dir in agent_dir.glob("mcp-remote-*"):
-                    token_files = list(mcp_dir.glob("*_tokens.json"))
-                    if token_files:
+                    if next(mcp_dir.glob("*_tokens.json"), None) is not None:
                         agents[agent_dir.name] = agent_dir
                         break
         
@@ -207,10 +206,10 @@ class MCPServerTester:
         # Generate test arguments based on tool
         test_args = self._generate_test_args(tool_name)
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             result = await session.call_tool(tool_name, test_args)
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             
             # Validate response
             success = result is not None
@@ -228,7 +227,7 @@ class MCPServerTester:
             )
             
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             
             if verbose:
                 print(f"  ❌ {tool_name}: {str(e)[:50]}")
@@ -340,7 +339,7 @@ class MCPServerTester:
             }
             
             try:
-                start = time.time()
+                start = time.perf_counter()
                 async with streamablehttp_client(
                     url=self.server_url,
                     headers=headers,
@@ -352,7 +351,7 @@ class MCPServerTester:
                         test_args = self._generate_test_args(tool_name)
                         await session.call_tool(tool_name, test_args)
                 
-                duration = (time.time() - start) * 1000
+                duration = (time.perf_counter() - start) * 1000
                 return duration
             except Exception:
                 return -1  # Error marker
@@ -18,10 +18,29 @@ from typing import Optional, Dict, Any, List
 from datetime import datetime
 import readline  # For better REPL experience
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 from ax_mcp_wait_client.simple_mcp_client import SimpleMCPClient, SimpleMCPClientWithRefresh
 from ax_mcp_wait_client.mcp_remote_wrapper import MCPRemoteWrapper
 
 
+def _json_loads(text: str) -> Any:
+    """Parse JSON arguments; errors are ``json.JSONDecodeError`` with either backend."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _json_dumps(obj: Any) -> str:
+    """Pretty-print a tool result with a two-space indent."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, indent=2)
+
+
 class UniversalMCPClient:
     """
     Universal client that can work with any MCP server.
@@ -45,6 +64,7 @@ class UniversalMCPClient:
         self.prompts: List[Dict] = []
         self.resources: List[Dict] = []
         self._tool_map: Dict[str, Dict] = {}
+        self._param_lines: Dict[str, List[str]] = {}
         
     async def discover(self) -> Dict[str, Any]:
         """
@@ -63,6 +83,7 @@ class UniversalMCPClient:
         # Discover tools
         self.tools = await self.client.list_tools()
         self._tool_map = {tool['name']: tool for tool in self.tools}
+        self._param_lines = {}
         print(f"📦 Found {len(self.tools)} tools")
         
         # Discover prompts
@@ -105,18 +126,32 @@ class UniversalMCPClient:
             if tool.get('description'):
                 print(f"    {tool['description']}")
             
-            if verbose and tool.get('inputSchema'):
-                schema = tool['inputSchema']
-                if schema.get('properties'):
+            if verbose:
+                param_lines = self._parameter_lines(tool)
+                if param_lines:
                     print("    Parameters:")
-                    for name, prop in schema['properties'].items():
-                        required = name in schema.get('required', [])
-                        req_mark = "*" if required else ""
-                        desc = prop.get('description', '')
-                        type_str = prop.get('type', 'any')
-                        print(f"      - {name}{req_mark} ({type_str}): {desc}")
+                    print("\n".join(param_lines))
             print()
     
+    def _parameter_lines(self, tool: Dict) -> List[str]:
+        """Format a tool's parameters once per discovery and reuse the lines."""
+        cached = self._param_lines.get(tool['name'])
+        if cached is not None:
+            return cached
+        
+        lines: List[str] = []
+        schema = tool.get('inputSchema') or {}
+        properties = schema.get('properties') or {}
+        required = set(schema.get('required', []))
+        for name, prop in properties.items():
+            req_mark = "*" if name in required else ""
+            desc = prop.get('description', '')
+            type_str = prop.get('type', 'any')
+            lines.append(f"      - {name}{req_mark} ({type_str}): {desc}")
+        
+        self._param_lines[tool['name']] = lines
+        return lines
+    
     async def call_tool(self, tool_name: str, args: Optional[Dict] = None) -> Any:
         """
         Call a tool with arguments.
@@ -275,7 +310,7 @@ class UniversalMCPClient:
                     args = {}
                     if len(tool_parts) > 1:
                         try:
-                            args = json.loads(tool_parts[1])
+                            args = _json_loads(tool_parts[1])
                         except json.JSONDecodeError:
                             print("❌ Invalid JSON arguments")
                             continue
@@ -286,7 +321,7 @@ class UniversalMCPClient:
                         if isinstance(result, str):
                             print(result)
                         else:
-                            print(json.dumps(result, indent=2))
+                            print(_json_dumps(result))
                 
                 else:
                     print(f"Unknown command: {cmd}")
@@ -433,7 +468,7 @@ async def main():
         tool_args = {}
         if args.args:
             try:
-                tool_args = json.loads(args.args)
+                tool_args = _json_loads(args.args)
             except json.JSONDecodeError:
                 print(f"❌ Invalid JSON arguments: {args.args}")
                 return 1
@@ -443,7 +478,7 @@ async def main():
             if isinstance(result, str):
                 print(result)
             else:
-                print(json.dumps(result, indent=2))
+                print(_json_dumps(result))
     
     elif args.repl:
         await universal_client.interactive_repl()
@@ -3,11 +3,13 @@ import asyncio
 import glob
 import json
 import os
+import re
 import sys
 import threading
 import time
 import uuid
 import webbrowser
+from collections import OrderedDict
 from datetime import timedelta
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from typing import Any, Optional
@@ -27,6 +29,42 @@ from mcp.shared.auth import (
 from .handlers import load_handlers, HandlerContext
 
 
+_STAMP_CACHE: dict[str, Any] = {"second": -1, "stamp": ""}
+# Leading whitespace then an object/array opener, matched in place
+_JSON_START = re.compile(r"\s*[\[{]")
+
+
+def _timestamp() -> str:
+    """Local "YYYY-mm-dd HH:MM:SS" stamp for output lines, formatted at most once per second."""
+    second = int(time.time())
+    if second != _STAMP_CACHE["second"]:
+        _STAMP_CACHE["second"] = second
+        _STAMP_CACHE["stamp"] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+    return _STAMP_CACHE["stamp"]
+
+
+class RecentIds:
+    """Set of recently handled message IDs, bounded by evicting the oldest."""
+
+    __slots__ = ("capacity", "_ids")
+
+    def __init__(self, capacity: int = 4096) -> None:
+        self.capacity = capacity
+        self._ids: OrderedDict[str, None] = OrderedDict()
+
+    def __contains__(self, message_id: str) -> bool:
+        return message_id in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, message_id: str) -> None:
+        self._ids[message_id] = None
+        self._ids.move_to_end(message_id)
+        if len(self._ids) > self.capacity:
+            self._ids.popitem(last=False)
+
+
 class InMemoryTokenStorage(TokenStorage):
     def __init__(self) -> None:
         self._tokens: Optional[OAuthToken] = None
@@ -55,12 +93,11 @@ class FileTokenStorage(TokenStorage):
         self._explicit_file: Optional[str] = os.environ.get("MCP_TOKEN_FILE")
 
     def _find_latest(self, pattern: str) -> Optional[str]:
-        paths = sorted(
-            glob.glob(os.path.join(self.base_dir, pattern)),
-            key=lambda p: os.path.getmtime(p),
-            reverse=True,
+        return max(
+            glob.iglob(os.path.join(self.base_dir, pattern)),
+            key=os.path.getmtime,
+            default=None,
         )
-        return paths[0] if paths else None
 
     def _token_file(self) -> str:
         # If an explicit token file is provided, prefer it
@@ -70,14 +107,10 @@ class FileTokenStorage(TokenStorage):
             self._token_path = path
             return path
         # Use mcp-remote directory structure like other MCP clients
-        import glob as _glob
-        candidates = []
-        for pattern in ["mcp-remote-*/*_tokens.json"]:
-            candidates.extend(_glob.glob(os.path.join(self.base_dir, pattern)))
-        if candidates:
-            candidates.sort(key=lambda p: os.path.getmtime(p), reverse=True)
-            self._token_path = candidates[0]
-            return candidates[0]
+        latest = self._find_latest("mcp-remote-*/*_tokens.json")
+        if latest:
+            self._token_path = latest
+            return latest
         # If no existing file, create a new one in mcp-remote directory
         mcp_dir = os.path.join(self.base_dir, "mcp-remote-0.1.18")
         os.makedirs(mcp_dir, exist_ok=True)
@@ -235,8 +268,8 @@ class CallbackServer:
             self._thread.join(timeout=1)
 
     def wait_for_code(self, timeout_sec: int = 300) -> tuple[str, Optional[str]]:
-        started = time.time()
-        while time.time() - started < timeout_sec:
+        started = time.monotonic()
+        while time.monotonic() - started < timeout_sec:
             if self._state.get("authorization_code"):
                 return self._state["authorization_code"], self._state.get("state")
             if self._state.get("error"):
@@ -344,6 +377,17 @@ async def monitor_messages(
     handlers = load_handlers(handler_specs)
     ctx = HandlerContext(agent_name=agent_name, server_url=server_url)
 
+    # The long-poll arguments never change; build them once
+    check_args = {
+        "action": "check",
+        "wait": True,
+        "wait_mode": wait_mode,
+        "timeout": max(timeout_seconds, 600),
+        "poll_interval": 60,
+        "limit": limit,
+        "mode": mode,
+    }
+
     while True:
         try:
             async with (await open_transport()) as (read_stream, write_stream, get_session_id):
@@ -355,35 +399,29 @@ async def monitor_messages(
                         flush=True
                     )
 
-                    # Track processed message IDs to avoid duplicate echoes across iterations
-                    processed_ids: set[str] = set()
+                    # Track processed message IDs to avoid duplicate echoes across iterations;
+                    # bounded so a long-running monitor doesn't grow without limit
+                    processed_ids = RecentIds()
                     first_output_printed = False
 
                     while True:
                         try:
-                            args = {
-                                "action": "check",
-                                "wait": True,
-                                "wait_mode": wait_mode,
-                                "timeout": max(timeout_seconds, 600),
-                                "poll_interval": 60,
-                                "limit": limit,
-                                "mode": mode,
-                            }
-                            result = await session.call_tool("messages", arguments=args)
+                            result = await session.call_tool("messages", arguments=check_args)
 
                             payload: Any
                             if getattr(result, "structuredContent", None):
                                 payload = result.structuredContent
                             else:
-                                texts: list[str] = []
-                                for c in getattr(result, "content", []) or []:
-                                    if getattr(c, "type", "") == "text" and hasattr(c, "text"):
-                                        texts.append(c.text)
-                                payload = "\n".join(texts) if texts else getattr(result, "__dict__", "")
+                                content = result.content or ()
+                                if len(content) == 1 and content[0].type == "text":
+                                    # Common case: one text block, no list or join needed
+                                    payload = content[0].text
+                                else:
+                                    texts = [c.text for c in content if c.type == "text"]
+                                    payload = "\n".join(texts) if texts else getattr(result, "__dict__", "")
 
                             if debug:
-                                ts = time.strftime("%Y-%m-%d %H:%M:%S")
+                                ts = _timestamp()
                                 try:
                                     dbg = payload if isinstance(payload, (dict, list)) else str(payload)
                                     print(f"[{ts}] debug: raw payload keys={list(dbg.keys()) if isinstance(dbg, dict) else 'n/a'}", flush=True)
@@ -396,12 +434,12 @@ async def monitor_messages(
                                 except Exception:
                                     print(json.dumps({"event": str(payload)}, ensure_ascii=False), flush=True)
                             else:
-                                ts = time.strftime("%Y-%m-%d %H:%M:%S")
+                                ts = _timestamp()
                                 print(f"[{ts}] event: {payload}", flush=True)
 
                             extracted = _extract_messages(payload)
                             if debug:
-                                ts = time.strftime("%Y-%m-%d %H:%M:%S")
+                                ts = _timestamp()
                                 print(f"[{ts}] debug: extracted {len(extracted)} message(s)", flush=True)
 
                             
@@ -427,7 +465,7 @@ async def monitor_messages(
                                     content = (raw_content or msg.get("text") or msg.get("body") or "").strip()
 
                                 if debug:
-                                    ts = time.strftime("%Y-%m-%d %H:%M:%S")
+                                    ts = _timestamp()
                                     print(f"[{ts}] debug: msg id={parent_id} content_len={len(content)}", flush=True)
 
                                 if not parent_id or not content:
@@ -445,7 +483,7 @@ async def monitor_messages(
                                             if handled and once and not first_output_printed:
                                                 # Print a concise success line with the message id and a short preview, then exit.
                                                 preview = (content[:120] + "…") if len(content) > 120 else content
-                                                ts2 = time.strftime("%Y-%m-%d %H:%M:%S")
+                                                ts2 = _timestamp()
                                                 if json_output:
                                                     try:
                                                         print(json.dumps({"received": True, "id": parent_id, "content": content, "timestamp": ts2}, ensure_ascii=False), flush=True)
@@ -457,13 +495,13 @@ async def monitor_messages(
                                                 return
                                             break
                                     except Exception as ee:
-                                        ets = time.strftime("%Y-%m-%d %H:%M:%S")
+                                        ets = _timestamp()
                                         mid = parent_id or "?"
                                         print(f"[{ets}] warn: handler error for {mid}: {ee}", flush=True)
                         except asyncio.CancelledError:
                             raise
                         except Exception as e:
-                            ts = time.strftime("%Y-%m-%d %H:%M:%S")
+                            ts = _timestamp()
                             print(f"[{ts}] warn: wait loop error: {e}")
                             await asyncio.sleep(2)
                             break
@@ -471,7 +509,7 @@ async def monitor_messages(
         except asyncio.CancelledError:
             raise
         except Exception as e:
-            ts = time.strftime("%Y-%m-%d %H:%M:%S")
+            ts = _timestamp()
             print(f"[{ts}] error: connection dropped: {e}; reconnecting in 3s...")
             await asyncio.sleep(3)
 
@@ -482,6 +520,10 @@ def _extract_messages(payload: Any) -> list[dict]:
             return []
         data = payload
         if isinstance(payload, str):
+            # Most wait payloads are plain-text digests; only a JSON document
+            # can yield messages, so skip the doomed parse for everything else
+            if not _JSON_START.match(payload):
+                return []
             try:
                 data = json.loads(payload)
             except Exception:
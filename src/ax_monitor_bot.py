@@ -6,44 +6,67 @@ This bot monitors aX platform messages and processes them through configurable p
 """
 
 import os
+import re
 import sys
 import json
 import time
+import uuid
+import random
 import asyncio
 import importlib
 import logging
 import warnings
 import io
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any
 
 from message_queue import MessageQueue, MessageJob
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+# Server-side long-poll window, and how far past it a poll counts as stalled
+POLL_TIMEOUT_SECONDS = 60
+STALL_GRACE_SECONDS = 30
+# Bounds for the jittered delay between failed polls
+RETRY_BASE_SECONDS = 10
+RETRY_CAP_SECONDS = 120
+
+logger = logging.getLogger("ax_monitor_bot")
+
 # Suppress pydantic validation warnings
 warnings.filterwarnings("ignore", category=UserWarning, module="pydantic")
 
 
 class FilteredStderr:
     """Custom stderr that filters out specific error messages"""
+    # Immutable class constant: shared by instances, never copied per write
+    SUPPRESS_PATTERNS = (
+        "Error parsing JSON response",
+        "pydantic_core._pydantic_core.ValidationError",
+        "JSONRPCMessage",
+        "'id': None",
+        "id: None",
+        "Field required [type=missing",
+        "Input should be a valid",
+    )
+    # All patterns folded into one alternation: a single scan per write
+    # instead of one substring search per pattern
+    SUPPRESS_RE = re.compile("|".join(map(re.escape, SUPPRESS_PATTERNS)))
+
     def __init__(self, original_stderr):
         self.original = original_stderr
         self.buffer = []
-        self.suppress_patterns = [
-            "Error parsing JSON response",
-            "pydantic_core._pydantic_core.ValidationError",
-            "JSONRPCMessage",
-            "'id': None",
-            "id: None",
-            "Field required [type=missing",
-            "Input should be a valid",
-        ]
+        self.suppress_patterns = self.SUPPRESS_PATTERNS
     
     def write(self, text):
         # Check if we should suppress this output
-        for pattern in self.suppress_patterns:
-            if pattern in text:
-                return  # Suppress this output
+        if self.SUPPRESS_RE.search(text):
+            return  # Suppress this output
         # Otherwise, write to original stderr
         self.original.write(text)
     
@@ -66,6 +89,15 @@ from ax_mcp_wait_client.config_loader import parse_mcp_config, get_default_confi
 from ax_mcp_wait_client.mcp_client import MCPClient
 
 
+@lru_cache(maxsize=None)
+def _plugin_class(plugin_type: str) -> type:
+    """Resolve plugins.<type>_plugin.<Type>Plugin once per plugin type."""
+    module = importlib.import_module(f"plugins.{plugin_type}_plugin")
+    # Get the plugin class (assumes it follows naming convention)
+    class_name = ''.join(word.capitalize() for word in plugin_type.split('_')) + 'Plugin'
+    return getattr(module, class_name)
+
+
 def load_plugin(plugin_type: str, config: Optional[Dict[str, Any]] = None):
     """
     Load a plugin by type.
@@ -78,22 +110,29 @@ def load_plugin(plugin_type: str, config: Optional[Dict[str, Any]] = None):
         Plugin instance
     """
     try:
-        # Try to import the plugin module
-        module_name = f"plugins.{plugin_type}_plugin"
-        module = importlib.import_module(module_name)
-        
-        # Get the plugin class (assumes it follows naming convention)
-        class_name = ''.join(word.capitalize() for word in plugin_type.split('_')) + 'Plugin'
-        plugin_class = getattr(module, class_name)
-        
         # Create and return plugin instance
-        return plugin_class(config)
+        return _plugin_class(plugin_type)(config)
     except (ImportError, AttributeError) as e:
         print(f"❌ Failed to load plugin '{plugin_type}': {e}")
         print(f"   Available plugins: ollama, echo, openrouter")
         sys.exit(1)
 
 
+def read_plugin_config(path: str) -> Dict[str, Any]:
+    """Load a plugin configuration JSON file, reusing the parse while it is unchanged."""
+    config_path = Path(path).expanduser()
+    # Keyed on mtime so edits to the file are picked up on the next call
+    return _read_plugin_config_cached(config_path, config_path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _read_plugin_config_cached(config_path: Path, mtime_ns: int) -> Dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(config_path.read_bytes())
+    with open(config_path, 'r') as f:
+        return json.load(f)
+
+
 async def show_progress(start_time: float):
     """Print a heartbeat every 30s; 10 per row = 5 minutes.
 
@@ -109,7 +148,7 @@ async def show_progress(start_time: float):
         print("💓", end='', flush=True)
         hearts_in_row += 1
         if hearts_in_row >= 10:
-            mins = int((time.time() - start_time) // 60)
+            mins = int((time.monotonic() - start_time) // 60)
             print(f" [{mins}m]")
             # Start next row
             print("💭 Waiting: ", end='', flush=True)
@@ -130,6 +169,12 @@ async def main():
     logging.getLogger('mcp.client.streamable_http').setLevel(logging.CRITICAL)
     logging.getLogger('pydantic').setLevel(logging.CRITICAL)
     logging.getLogger('pydantic_core').setLevel(logging.CRITICAL)
+    # Per-mention bot output: bare messages on stdout, formatted lazily by logging
+    bot_handler = logging.StreamHandler(sys.stdout)
+    bot_handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(bot_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
     # Quiet our internal auth refresh noise
     logging.getLogger('ax_mcp_wait_client.bearer_refresh').setLevel(logging.WARNING)
     logging.getLogger('ax_mcp_wait_client.mcp_client').setLevel(logging.WARNING)
@@ -184,6 +229,11 @@ async def main():
     
     # Get agent name for display
     agent_name = client.agent_name
+    agent_mention = f'@{agent_name}'
+    # A bullet line that also mentions us, found in one C-level scan per payload
+    mention_line_pattern = re.compile(
+        rf"^(?=[^\n]*•)(?=[^\n]*{re.escape(agent_mention)})[^\n]*", re.MULTILINE
+    )
     
     # Get plugin type from environment or default
     plugin_type = os.getenv('PLUGIN_TYPE', 'ollama')
@@ -192,8 +242,8 @@ async def main():
     plugin_config = {}
     plugin_config_file = os.getenv('PLUGIN_CONFIG')
     if plugin_config_file and os.path.exists(plugin_config_file):
-        with open(plugin_config_file, 'r') as f:
-            plugin_config = json.load(f)
+        # Copy so a plugin mutating its config cannot poison the cache
+        plugin_config = dict(read_plugin_config(plugin_config_file))
     
     # Load the plugin
     print(f"🔌 Loading plugin: {plugin_type}")
@@ -216,8 +266,8 @@ async def main():
     print("=" * 60)
     print("\n🚀 Starting bot...")
     
-    # Track timing for heartbeat
-    start_time = time.time()
+    # Track timing for heartbeat (monotonic: only used for elapsed math)
+    start_time = time.monotonic()
     message_queue = MessageQueue()
     worker_task: Optional[asyncio.Task[None]] = None
     
@@ -226,34 +276,55 @@ async def main():
         printed_listen = False
         progress_task = None
         status_block_printed = -1  # for periodic "no mentions" summary
+        retry_delay = RETRY_BASE_SECONDS
+        # Set by the queue worker after a failed send; the poll loop owns the
+        # connection, so it drops the session before its next check
+        reconnect_requested = False
+
+        async def send_response(response: str) -> None:
+            nonlocal reconnect_requested
+
+            # In loop mode this runs in the worker task, which must not
+            # disconnect or reconnect a session the poll loop entered. A
+            # failed send flags the poll loop to reconnect, then is retried
+            # once under the same idempotency key.
+            idempotency_key = str(uuid.uuid4())
+            for attempt in range(2 if loop_mode else 1):
+                logger.info("\n📤 Sending response...")
+                try:
+                    sent = await client.send_message(
+                        response, idempotency_key=idempotency_key, reconnect=not loop_mode
+                    )
+                except Exception as e:
+                    logger.error("❌ Send error: %s", e)
+                    sent = False
+                if sent:
+                    logger.info("✅ Response sent successfully!")
+                    return
+                logger.error("❌ Failed to send response")
+                if loop_mode:
+                    reconnect_requested = True
+                    if attempt == 0:
+                        logger.warning("⏳ Waiting 30 seconds before retrying due to send failure...")
+                        await asyncio.sleep(30)
 
         async def process_queue_job(job: MessageJob) -> None:
             nonlocal progress_task
 
             mention_text = job.payload.get("mention", "")
-            print(
-                f"\n🚚 Processing job {job.id}"
-                f" (queue depth: {message_queue.size()})"
-            )
+            logger.info("\n🚚 Processing job %s (queue depth: %d)", job.id, message_queue.size())
 
             try:
                 response = await plugin.process_message(mention_text)
                 if response is not None:
-                    print(f"Plugin response: {response[:200]}...")
+                    logger.info("Plugin response: %.200s...", response)
                 else:
                     response = ""
             except Exception as e:
-                print(f"❌ Plugin error: {e}")
+                logger.error("❌ Plugin error: %s", e)
                 response = f"Sorry, I encountered an error: {e}"
 
-            print("\n📤 Sending response...")
-            if await client.send_message(response):
-                print("✅ Response sent successfully!")
-            else:
-                print("❌ Failed to send response")
-                if loop_mode:
-                    print("⏳ Waiting 30 seconds before retrying due to send failure...")
-                    await asyncio.sleep(30)
+            await send_response(response)
 
             if loop_mode and (progress_task is None or progress_task.done()):
                 progress_task = asyncio.create_task(show_progress(start_time))
@@ -268,7 +339,7 @@ async def main():
                 try:
                     await process_queue_job(job)
                 except Exception as exc:
-                    print(f"❌ Queue worker error for job {getattr(job, 'id', '?')}: {exc}")
+                    logger.error("❌ Queue worker error for job %s: %s", getattr(job, 'id', '?'), exc)
                 finally:
                     message_queue.task_done()
 
@@ -288,8 +359,20 @@ async def main():
                 if progress_task is None or progress_task.done():
                     progress_task = asyncio.create_task(show_progress(start_time))
                 
+            if reconnect_requested:
+                reconnect_requested = False
+                # check_messages connects again on its first attempt
+                await client.disconnect()
+
             try:
-                messages = await client.check_messages(wait=loop_mode, timeout=60, limit=5)
+                # A poll that outlives its window has stalled; the client drops
+                # that session and reconnects itself, within this task
+                messages = await client.check_messages(
+                    wait=loop_mode,
+                    timeout=POLL_TIMEOUT_SECONDS,
+                    limit=5,
+                    stall_timeout=POLL_TIMEOUT_SECONDS + STALL_GRACE_SECONDS,
+                )
             except Exception as e:
                 error_msg = str(e)
                 if "504 Gateway Timeout" in error_msg or "Gateway Timeout" in error_msg:
@@ -303,8 +386,10 @@ async def main():
                 if not loop_mode:
                     return 1
                     
-                # Wait before retrying
-                await asyncio.sleep(10)
+                # Wait before retrying. Decorrelated jitter keeps a fleet of bots
+                # hit by the same 504 storm from retrying in lockstep.
+                retry_delay = min(RETRY_CAP_SECONDS, random.uniform(RETRY_BASE_SECONDS, retry_delay * 3))
+                await asyncio.sleep(retry_delay)
                 continue
             finally:
                 # Do not cancel progress task here; keep the heartbeat continuous
@@ -318,77 +403,70 @@ async def main():
                 await asyncio.sleep(30)
                 continue
             
+            retry_delay = RETRY_BASE_SECONDS
+            wait_success = '✅ WAIT SUCCESS' in messages
+
             # Only print message details if we got something
-            if '✅ WAIT SUCCESS' in messages or not loop_mode:
-                print("\n📨 Messages received:")
-                print(messages[:500] + "..." if len(messages) > 500 else messages)
+            if wait_success or not loop_mode:
+                logger.info(
+                    "\n📨 Messages received:\n%.500s%s", messages, "..." if len(messages) > 500 else ""
+                )
         
             # Look for mentions of our agent
             latest_mention = None
             latest_author = None
             
             # In wait mode, the format is simpler: "• user: message"
-            if loop_mode and '✅ WAIT SUCCESS' in messages:
-                lines = messages.split('\n')
-                for i, line in enumerate(lines):
-                    if '•' in line and f'@{agent_name}' in line:
-                        # Extract message after the bullet and username
-                        parts = line.split(': ', 1)
-                        if len(parts) > 1:
-                            # Capture the author (between the bullet and the colon)
-                            try:
-                                bullet, _ = line.split(': ', 1)
-                                latest_author = bullet.replace('•', '').strip()
-                            except Exception:
-                                latest_author = None
-                            # Start with the first line content
-                            message_lines = [parts[1]]
-                            # Collect continuation lines until we hit the end marker
-                            j = i + 1
-                            while j < len(lines):
-                                next_line = lines[j]
-                                # Stop if we hit the end of the message block
-                                if next_line.strip() == '' and j + 1 < len(lines):
-                                    # Check if next non-empty line is a marker
-                                    k = j + 1
-                                    while k < len(lines) and lines[k].strip() == '':
-                                        k += 1
-                                    if k < len(lines) and ('🎯' in lines[k] or '📨' in lines[k] or lines[k].startswith('•')):
-                                        break
-                                # Stop at obvious markers
-                                if '🎯' in next_line or next_line.startswith('•'):
+            if loop_mode and wait_success:
+                for match in mention_line_pattern.finditer(messages):
+                    # Split once into author (between the bullet and the colon) and message
+                    bullet, sep, first_text = match.group(0).partition(': ')
+                    if sep:
+                        latest_author = bullet.replace('•', '').strip()
+                        # Start with the first line content
+                        message_lines = [first_text]
+                        # Collect continuation lines until we hit the end marker
+                        lines = messages[match.end():].split('\n')[1:]
+                        j = 0
+                        while j < len(lines):
+                            next_line = lines[j]
+                            # Stop if we hit the end of the message block
+                            if next_line.strip() == '' and j + 1 < len(lines):
+                                # Check if next non-empty line is a marker
+                                k = j + 1
+                                while k < len(lines) and lines[k].strip() == '':
+                                    k += 1
+                                if k < len(lines) and ('🎯' in lines[k] or '📨' in lines[k] or lines[k].startswith('•')):
                                     break
-                                # Add all content lines (even empty ones for formatting)
-                                message_lines.append(next_line)
-                                j += 1
-                            # Join and clean up extra whitespace at the end
-                            latest_mention = '\n'.join(message_lines).rstrip()
-                            break
+                            # Stop at obvious markers
+                            if '🎯' in next_line or next_line.startswith('•'):
+                                break
+                            # Add all content lines (even empty ones for formatting)
+                            message_lines.append(next_line)
+                            j += 1
+                        # Join and clean up extra whitespace at the end
+                        latest_mention = '\n'.join(message_lines).rstrip()
+                        break
             else:
                 # Non-wait mode: standard format with [id:...]
                 for line in messages.split('\n'):
-                    if f'@{agent_name}' in line and '[id:' in line:
+                    if agent_mention in line and '[id:' in line:
                         # Skip our own messages (they start with our agent name)
-                        if line.strip().startswith(f'@{agent_name}'):
+                        if line.strip().startswith(agent_mention):
                             continue
-                        # Extract just the message content after the ID
-                        parts = line.split(']: ')
-                        if len(parts) > 1:
-                            latest_mention = parts[1]
-                            # Best-effort author capture from prefix before ']:' if formatted like "user [id:...]: msg"
-                            try:
-                                prefix = line.split(']:', 1)[0]
-                                # e.g. "user [id:xyz" -> take the first token
-                                latest_author = prefix.split()[0].lstrip('@')
-                            except Exception:
-                                latest_author = None
+                        # Extract the message content after the ID and the author prefix in one split
+                        prefix, sep, latest_mention = line.partition(']: ')
+                        if sep:
+                            # Best-effort author capture from a prefix like "user [id:xyz"
+                            tokens = prefix.split()
+                            latest_author = tokens[0].lstrip('@') if tokens else None
                             break  # Stop at first (most recent) mention
             
             if not latest_mention:
                 # Print a concise status only every 10 minutes
                 if not loop_mode:
                     return 0
-                elapsed = int(time.time() - start_time)
+                elapsed = int(time.monotonic() - start_time)
                 block = elapsed // 600
                 if block > status_block_printed:
                     mins = block * 10 if block > 0 else 0
@@ -408,7 +486,7 @@ async def main():
                 except asyncio.CancelledError:
                     pass
                 progress_task = None
-            print(f"\n🎯 Found mention: {latest_mention}")
+            logger.info("\n🎯 Found mention: %s", latest_mention)
 
             # Step 3: Process with plugin
             if not loop_mode:
@@ -429,10 +507,7 @@ async def main():
                     "author": latest_author,
                 }
             )
-            print(
-                f"📥 Enqueued job {job.id}"
-                f" (queue depth: {message_queue.size()})"
-            )
+            logger.info("📥 Enqueued job %s (queue depth: %d)", job.id, message_queue.size())
 
             if progress_task is None or progress_task.done():
                 progress_task = asyncio.create_task(show_progress(start_time))
@@ -441,18 +516,18 @@ async def main():
             continue
                 
     finally:
-        # Clean up connection
-        try:
-            await client.disconnect()
-        except Exception as e:
-            # Ignore errors during cleanup
-            pass
         if worker_task:
             worker_task.cancel()
             try:
                 await worker_task
             except asyncio.CancelledError:
                 pass
+        # Clean up connection
+        try:
+            await client.close()
+        except Exception as e:
+            # Ignore errors during cleanup
+            pass
 
 
 if __name__ == "__main__":
@@ -0,0 +1,23 @@
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("mcp")
+
+from ax_mcp_wait_client.config_loader import parse_mcp_config
+
+
+def test_parse_mcp_config_reads_server_settings(mcp_config_file: Path):
+    cfg = parse_mcp_config(str(mcp_config_file))
+    assert cfg.server_url == "https://api.paxai.app/mcp"
+    assert cfg.oauth_url == "https://api.paxai.app"
+    assert cfg.agent_name == "test_agent"
+
+
+def test_parse_mcp_config_returns_independent_copies(mcp_config_file: Path):
+    first = parse_mcp_config(str(mcp_config_file))
+    first.agent_name = "mutated"
+
+    second = parse_mcp_config(str(mcp_config_file))
+    assert second is not first
+    assert second.agent_name == "test_agent"
@@ -1,9 +1,12 @@
+import asyncio
 import json
 
+from scripts.evaluation.config import CandidateConfig, DatasetConfig, EvalRunConfig, JudgeConfig
 from scripts.evaluation.metrics import Verdict, confidence_ok
 from scripts.evaluation.parsers import extract_json_block, parse_verdict
+from scripts.evaluation.serialization import dumps_line, dumps_pretty, fingerprint, loads
 from scripts.evaluation.templates import build_judge_prompt
-from scripts.evaluation.utils import build_summary_message
+from scripts.evaluation.utils import PROGRESS_BATCH_SIZE, AxAnnouncer, build_summary_message
 
 
 def test_build_judge_prompt_contains_sections():
@@ -35,6 +38,31 @@ def test_parse_verdict_handles_bad_data():
     assert verdict.confidence == 0.0
 
 
+def test_serialization_round_trip():
+    payload = {"prompt": "Résumé ✓", "verdict": {"winner": "A", "confidence": 0.75}}
+    line = dumps_line(payload)
+    assert line.endswith(b"\n") and line.count(b"\n") == 1
+    assert loads(line) == payload
+    pretty = dumps_pretty(payload)
+    assert pretty.endswith(b"\n")
+    assert "Résumé ✓" in pretty.decode("utf-8")
+    assert json.loads(pretty) == payload
+
+
+def test_fingerprint_is_stable_and_key_order_independent():
+    assert fingerprint("same prompt") == fingerprint("same prompt")
+    assert fingerprint("same prompt") != fingerprint("other prompt")
+    assert len(fingerprint("x")) == 32
+    assert fingerprint({"a": 1, "b": [1, 2]}) == fingerprint({"b": [1, 2], "a": 1})
+
+
+def test_parse_verdict_plain_and_wrapped_json():
+    plain = parse_verdict('  {"winner": "b", "confidence": 1.4, "reason": " close call "}\n')
+    assert plain == Verdict("B", 1.0, "close call")
+    wrapped = parse_verdict('Verdict: {"winner": "A", "confidence": 0.8, "reason": "clear"} done')
+    assert wrapped == Verdict("A", 0.8, "clear")
+
+
 def test_confidence_ok():
     assert confidence_ok(Verdict("A", 0.7, ""), 0.6)
     assert not confidence_ok(Verdict("B", 0.5, ""), 0.6)
@@ -60,3 +88,39 @@ def test_build_summary_message_formats_output(tmp_path):
     assert "model-a vs model-b" in message
     assert "Wins: 3 - 2" in message
     assert str(run_dir) in message
+
+
+def test_announcer_coalesces_progress_updates(tmp_path):
+    class FakeClient:
+        def __init__(self):
+            self.sent = []
+
+        async def send_message(self, message):
+            self.sent.append(message)
+            return True
+
+        async def close(self):
+            pass
+
+    config = EvalRunConfig(
+        candidate_a=CandidateConfig(label="A", model="model-a"),
+        candidate_b=CandidateConfig(label="B", model="model-b"),
+        judge=JudgeConfig(model="judge-model"),
+        dataset=DatasetConfig.from_prompts(["p"]),
+        session_tags=["#eval"],
+    )
+    record = {"prompt": "p", "verdict": {"winner": "A", "confidence": 0.9, "reason": "ok"}}
+
+    async def scenario():
+        client = FakeClient()
+        announcer = AxAnnouncer(client, config, tmp_path)
+        for sample_id in range(PROGRESS_BATCH_SIZE + 1):
+            await announcer.send_progress(sample_id, record, {"A": sample_id + 1}, sample_id + 1)
+        await announcer.close()
+        return client.sent
+
+    sent = asyncio.run(scenario())
+
+    assert 1 < len(sent) < PROGRESS_BATCH_SIZE + 1
+    assert all(message.startswith("#eval") for message in sent)
+    assert sum(message.count("🎯 Sample") for message in sent) == PROGRESS_BATCH_SIZE + 1
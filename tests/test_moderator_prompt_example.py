@@ -0,0 +1,52 @@
+import pytest
+
+pytest.importorskip("mcp")
+
+from scripts.moderator_prompt_example import HandleSpec, apply_session_tags, render_scenario_text
+
+
+def test_apply_session_tags_skips_exact_hashtag():
+    message, changed = apply_session_tags("Kickoff #ai", ["#ai"])
+    assert (message, changed) == ("Kickoff #ai", False)
+
+
+def test_apply_session_tags_prefix_is_not_a_match():
+    message, changed = apply_session_tags("Kickoff #aiweek", ["#ai"])
+    assert changed is True
+    assert message == "Kickoff #aiweek\n\n#ai"
+
+
+def test_apply_session_tags_is_case_insensitive():
+    message, changed = apply_session_tags("Kickoff #AI #Debate", ["#ai", "#debate", "#new"])
+    assert changed is True
+    assert message == "Kickoff #AI #Debate\n\n#new"
+
+
+def test_apply_session_tags_non_token_tags_use_substring_check():
+    message, changed = apply_session_tags("Welcome to Round 1 of the game\n", ["round 1", "#go"])
+    assert changed is True
+    assert message == "Welcome to Round 1 of the game\n\n#go"
+    assert apply_session_tags("anything", []) == ("anything", False)
+
+
+def test_handle_spec_normalizes_at_prefix():
+    for raw in ("Alice", "@Alice", "  @Alice \n"):
+        spec = HandleSpec.of(raw)
+        assert (spec.at, spec.name, spec.at_lower) == ("@Alice", "Alice", "@alice")
+        assert str(spec) == "@Alice"
+
+
+def test_handle_spec_of_is_idempotent():
+    spec = HandleSpec.of("Alice")
+    assert HandleSpec.of(spec) is spec
+    assert HandleSpec.of("@Alice") == spec
+    assert not hasattr(spec, "__dict__")
+
+
+def test_render_scenario_text_substitutes_in_one_pass():
+    raw = "{initiator_handle} ({initiator_name}) vs {player2_handle}; {unknown_handle}"
+    assert render_scenario_text(raw, "alice", "@Bob") == "@alice (alice) vs @Bob; {unknown_handle}"
+    # Inserted values are not scanned again for placeholders
+    rendered = render_scenario_text("{initiator_handle} -> {responder_name}", "{responder_name}", "bob")
+    assert rendered == "@{responder_name} -> bob"
+    assert render_scenario_text(None, "alice", "bob") is None
@@ -0,0 +1,121 @@
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("mcp")
+
+from reliable_monitor import MessageStatus, ReliableMessageStore, ReliableMonitor, StoredMessage
+
+
+def make_message(message_id: bytes, raw_content: str = "✅ WAIT SUCCESS\n• alice: hi @bot") -> StoredMessage:
+    return StoredMessage(
+        id=message_id,
+        raw_content=raw_content,
+        parsed_author=None,
+        parsed_mention=None,
+        sender_handle=None,
+        status=MessageStatus.PENDING,
+        created_at=datetime.now(),
+        processed_at=None,
+        retry_count=0,
+        error_message=None,
+    )
+
+
+@pytest.fixture
+def store(tmp_path: Path):
+    message_store = ReliableMessageStore(str(tmp_path / "messages.db"))
+    yield message_store
+    message_store.close()
+
+
+def test_same_payload_is_stored_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, store: ReliableMessageStore):
+    monkeypatch.chdir(tmp_path)
+    monitor = ReliableMonitor(str(tmp_path / "mcp_config.json"))
+    monitor.message_store.close()
+    payload = "✅ WAIT SUCCESS\n• alice: hi @bot"
+
+    first_id = monitor._generate_message_id(payload)
+    second_id = monitor._generate_message_id(payload)
+
+    assert first_id == second_id
+    assert monitor._generate_message_id(payload + " again") != first_id
+    assert store.store_message(make_message(first_id, payload)) is True
+    assert store.store_message(make_message(second_id, payload)) is False
+    assert store._conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0] == 1
+
+
+def test_store_lifecycle_retry_dead_letter_and_cleanup(store: ReliableMessageStore):
+    first = make_message(b"\x01" * 16)
+    second = make_message(b"\x02" * 16)
+    assert store.store_message(first)
+    assert store.store_message(second)
+    assert [m.id for m in store.get_pending_messages()] == [first.id, second.id]
+
+    # A failed attempt writes the parsed fields and the outcome together
+    first.parsed_author = "alice"
+    first.parsed_mention = "• alice: hi @bot"
+    first.sender_handle = "@alice"
+    first.retry_count = 1
+    assert store.finalize_message(first, MessageStatus.FAILED, "Failed to send response")
+    assert first.status is MessageStatus.FAILED and first.processed_at is None
+    row = store._conn.execute(
+        "SELECT parsed_author, sender_handle, status, retry_count, error_message FROM messages WHERE id = ?",
+        (first.id,),
+    ).fetchone()
+    assert row == ("alice", "@alice", "failed", 1, "Failed to send response")
+
+    # Retry: failed rows under the limit go back to pending in one batch
+    assert store.get_retryable_messages(max_retries=5) == [(first.id, 1, None)]
+    assert store.get_retryable_messages(max_retries=1) == []
+    store.mark_pending([first.id])
+    assert {m.id: m.status for m in store.get_pending_messages()} == {
+        first.id: MessageStatus.PENDING,
+        second.id: MessageStatus.PENDING,
+    }
+
+    # Success on the retry, and the other message is dead-lettered
+    done_at = datetime(2026, 1, 1, 12, 0)
+    assert store.finalize_message(first, MessageStatus.COMPLETED, now=done_at)
+    assert first.processed_at == done_at
+    store.dead_letter_messages([(second.id, "Exceeded max retries (5)")], done_at)
+    assert store.get_pending_messages() == []
+    assert store._conn.execute(
+        "SELECT status, error_message FROM messages WHERE id = ?", (second.id,)
+    ).fetchone() == ("dead_letter", "Exceeded max retries (5)")
+
+    # Cleanup removes completed rows only, and only those before the cutoff
+    assert store.delete_completed_before(done_at) == 0
+    assert store.delete_completed_before(datetime(2026, 1, 2)) == 1
+    assert store._conn.execute("SELECT id FROM messages").fetchall() == [(second.id,)]
+
+
+def test_store_batches_roll_back_together(store: ReliableMessageStore):
+    message = make_message(b"\x03" * 16)
+    store.store_message(message)
+
+    with pytest.raises(RuntimeError):
+        with store._transaction() as conn:
+            conn.execute("UPDATE messages SET status = 'failed' WHERE id = ?", (message.id,))
+            raise RuntimeError("boom")
+
+    assert store.get_pending_messages()[0].status is MessageStatus.PENDING
+    # The long-lived connection stays in autocommit mode after the rollback
+    assert store._conn.in_transaction is False
+    # Empty batches return without opening a transaction
+    store.mark_pending([])
+    store.dead_letter_messages([], datetime.now())
+
+
+def test_store_persists_across_connections(tmp_path: Path):
+    db_path = str(tmp_path / "messages.db")
+    writer = ReliableMessageStore(db_path)
+    writer.store_message(make_message(b"\x04" * 16))
+    writer.close()
+
+    reader = ReliableMessageStore(db_path)
+    try:
+        assert [m.id for m in reader.get_pending_messages()] == [b"\x04" * 16]
+    finally:
+        reader.close()
@@ -0,0 +1,35 @@
+import pytest
+
+pytest.importorskip("mcp")
+
+from scripts.spam_mentions import interval_for, iter_mentions
+
+
+def test_interval_for_ramps_linearly_to_delay():
+    # t=0: the first gap is the start delay
+    assert interval_for(1, delay=0.2, start_delay=1.0, ramp=4) == pytest.approx(1.0)
+    # End of the ramp: the last ramped gap is one step short of the delay
+    assert interval_for(4, delay=0.2, start_delay=1.0, ramp=4) == pytest.approx(0.4)
+    # Past the ramp the gap settles at the steady delay
+    assert interval_for(5, delay=0.2, start_delay=1.0, ramp=4) == pytest.approx(0.2)
+    assert interval_for(500, delay=0.2, start_delay=1.0, ramp=4) == pytest.approx(0.2)
+
+
+def test_interval_for_without_ramp_uses_delay():
+    assert interval_for(1, delay=0.2, start_delay=1.0, ramp=0) == pytest.approx(0.2)
+
+
+def test_iter_mentions_wraps_round_robin():
+    mentions = list(iter_mentions(("@a", "@b", "@c"), 5))
+    assert mentions == [
+        (1, "@a queue test #"),
+        (2, "@b queue test #"),
+        (3, "@c queue test #"),
+        (4, "@a queue test #"),
+        (5, "@b queue test #"),
+    ]
+
+
+def test_iter_mentions_stops_at_count():
+    assert list(iter_mentions(("@a",), 0)) == []
+    assert [idx for idx, _ in iter_mentions(("@a", "@b"), 3)] == [1, 2, 3]
@@ -0,0 +1,37 @@
+import pytest
+
+pytest.importorskip("mcp")
+
+from ax_mcp_wait_client.wait_client import RecentIds
+
+
+def test_recent_ids_evicts_oldest_past_capacity():
+    recent = RecentIds(capacity=3)
+    for message_id in ("a", "b", "c", "d"):
+        recent.add(message_id)
+
+    assert len(recent) == 3
+    assert "a" not in recent
+    assert all(message_id in recent for message_id in ("b", "c", "d"))
+
+    recent.add("e")
+    assert "b" not in recent
+    assert len(recent) == 3
+
+
+def test_recent_ids_re_adding_refreshes_an_id():
+    recent = RecentIds(capacity=3)
+    for message_id in ("a", "b", "c"):
+        recent.add(message_id)
+
+    # Re-adding "a" makes it the newest, so "b" is evicted next
+    recent.add("a")
+    assert len(recent) == 3
+    recent.add("d")
+    assert "a" in recent
+    assert "b" not in recent
+
+    # A membership check alone does not refresh an id
+    assert "c" in recent
+    recent.add("e")
+    assert "c" not in recent